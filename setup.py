@@ -7,6 +7,7 @@ setup(
     install_requires=[
         "numpy",
         "pandas",
+        "pyarrow",
         "scikit-learn",
         "joblib",
         "requests",
@@ -37,7 +37,7 @@ class DataPipeline:
         logger.info("Processing matches data...")
         
         # Convert date to datetime
-        matches_df['date'] = pd.to_datetime(matches_df['date'])
+        matches_df['date'] = pd.to_datetime(matches_df['date'], format='%Y-%m-%d')
         
         # Extract year and month
         matches_df['year'] = matches_df['date'].dt.year
@@ -834,47 +834,47 @@ VENUE_INFO = {
     }
 }
 
+# Match lookup by ID (reversed so the first match with an ID wins)
+_MATCH_BY_ID = {match["match_id"]: match for match in reversed(IPL_2025_MATCHES)}
+
 def get_match_by_id(match_id: int) -> dict:
     """Get match details by match ID"""
+    return _MATCH_BY_ID.get(match_id)
+
+def _group_matches(*fields: str) -> dict:
+    """Group matches by their distinct values of the given fields, each list in schedule order"""
+    groups = {}
     for match in IPL_2025_MATCHES:
-        if match["match_id"] == match_id:
-            return match
-    return None
+        for key in dict.fromkeys(match[field] for field in fields):
+            groups.setdefault(key, []).append(match)
+    return groups
+
+# Match lookups by team, venue and date
+_TEAM_MATCHES = _group_matches("team1", "team2")
+_HOME_MATCHES = _group_matches("team1")
+_AWAY_MATCHES = _group_matches("team2")
+_VENUE_MATCHES = _group_matches("venue")
+_DATE_MATCHES = _group_matches("date")
 
 def get_team_matches(team_name: str) -> list:
     """Get all matches for a specific team"""
-    return [
-        match for match in IPL_2025_MATCHES
-        if match["team1"] == team_name or match["team2"] == team_name
-    ]
+    return list(_TEAM_MATCHES.get(team_name, ()))
 
 def get_home_matches(team_name: str) -> list:
     """Get all home matches for a specific team"""
-    return [
-        match for match in IPL_2025_MATCHES
-        if match["team1"] == team_name
-    ]
+    return list(_HOME_MATCHES.get(team_name, ()))
 
 def get_away_matches(team_name: str) -> list:
     """Get all away matches for a specific team"""
-    return [
-        match for match in IPL_2025_MATCHES
-        if match["team2"] == team_name
-    ]
+    return list(_AWAY_MATCHES.get(team_name, ()))
 
 def get_venue_matches(venue: str) -> list:
     """Get all matches at a specific venue"""
-    return [
-        match for match in IPL_2025_MATCHES
-        if match["venue"] == venue
-    ]
+    return list(_VENUE_MATCHES.get(venue, ()))
 
 def get_matches_by_date(date: str) -> list:
     """Get all matches on a specific date"""
-    return [
-        match for match in IPL_2025_MATCHES
-        if match["date"] == date
-    ]
+    return list(_DATE_MATCHES.get(date, ()))
 
 def get_matches_by_stage(stage: str) -> list:
     """Get all matches in a specific stage"""
@@ -36,7 +36,7 @@ class DataPipeline:
             deliveries_df = pd.read_csv(self.base_path / 'data' / 'historical' / 'deliveries.csv')
             
             # Process match data
-            matches_df['date'] = pd.to_datetime(matches_df['date'])
+            matches_df['date'] = pd.to_datetime(matches_df['date'], format='%Y-%m-%d')
             matches_df['season'] = matches_df['date'].dt.year
             
             # Process deliveries data
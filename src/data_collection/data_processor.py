@@ -1,16 +1,23 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional
 import logging
 from pathlib import Path
 import json
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from config import (
     DATA_DIR, HISTORICAL_DATA_FILE, PLAYER_STATS_FILE,
     VALIDATION_RULES, TEAMS, PLAYER_ROLES
 )
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -49,6 +56,17 @@ class DataProcessor:
             'Mohit Sharma': ['M Sharma', 'Mohit']
         }
         
+        # Cache of normalized player names and the loaded combined data
+        self._normalized_names = {}
+        self._combined_data = None
+        
+        # Venue conditions keyed by venue, loaded on first use
+        self._venue_conditions = None
+        
+        # Match data and its row-position indexes, loaded on first use
+        self._match_data = None
+        self._match_index = {}
+        
         # Default stats for new players based on role
         self.default_stats = {
             'batsman': {
@@ -115,21 +133,32 @@ class DataProcessor:
                 'Career_Matches_Batted': 10
             }
         }
+        
+        # Read-only views shared by the stats fallback path, so a miss does not allocate
+        self._default_stats_proxy = {
+            role: MappingProxyType(stats) for role, stats in self.default_stats.items()
+        }
     
     def normalize_player_name(self, name: str) -> str:
         """Normalize player name to match historical data"""
         if pd.isna(name):
             return ""
             
-        name = str(name).strip()
+        if name in self._normalized_names:
+            return self._normalized_names[name]
+            
+        normalized = str(name).strip()
         
         # Check direct mappings
         for standard_name, variants in self.player_mappings.items():
-            if name in variants or name == standard_name:
-                return standard_name
-                
-        # Remove special characters and extra spaces
-        normalized = re.sub(r'[^\w\s]', '', name).strip()
+            if normalized in variants or normalized == standard_name:
+                normalized = standard_name
+                break
+        else:
+            # Remove special characters and extra spaces
+            normalized = re.sub(r'[^\w\s]', '', normalized).strip()
+            
+        self._normalized_names[name] = normalized
         return normalized
         
     def get_player_role(self, name: str) -> str:
@@ -696,30 +725,37 @@ class DataProcessor:
         """Calculate player's performance under pressure"""
         try:
             # Load match data
-            match_data = pd.read_csv(self.data_path / 'processed' / 'match_data.csv')
+            match_data = self._load_match_data()
             
             # Get player's matches
-            player_matches = match_data[
-                (match_data['player_name'] == player_data['name']) |
-                (match_data['opponent'] == player_data['name'])
-            ]
+            player_matches = match_data.iloc[np.union1d(
+                self._match_rows('player_name', player_data['name']),
+                self._match_rows('opponent', player_data['name'])
+            )]
             
             # Calculate pressure metrics
             close_matches = player_matches[abs(player_matches['margin'] <= 20)]  # Matches won/lost by 20 runs or less
             chase_performance = player_matches[player_matches['is_chase'] == True]
             knockout_matches = player_matches[player_matches['is_knockout'] == True]
             
+            # Average all metric columns of each subset in a single pass
+            metric_cols = ['batting_average', 'strike_rate', 'bowling_average', 'economy']
+            empty_agg = pd.Series(0.0, index=metric_cols)
+            close_agg = close_matches[metric_cols].mean() if len(close_matches) else empty_agg
+            chase_agg = chase_performance[metric_cols].mean() if len(chase_performance) else empty_agg
+            knockout_agg = knockout_matches[metric_cols].mean() if len(knockout_matches) else empty_agg
+            
             metrics = {
-                'pressure_batting_avg': close_matches['batting_average'].mean() if not close_matches.empty else 0.0,
-                'pressure_strike_rate': close_matches['strike_rate'].mean() if not close_matches.empty else 0.0,
-                'chase_batting_avg': chase_performance['batting_average'].mean() if not chase_performance.empty else 0.0,
-                'chase_strike_rate': chase_performance['strike_rate'].mean() if not chase_performance.empty else 0.0,
-                'knockout_batting_avg': knockout_matches['batting_average'].mean() if not knockout_matches.empty else 0.0,
-                'knockout_strike_rate': knockout_matches['strike_rate'].mean() if not knockout_matches.empty else 0.0,
-                'pressure_bowling_avg': close_matches['bowling_average'].mean() if not close_matches.empty else 0.0,
-                'pressure_economy': close_matches['economy'].mean() if not close_matches.empty else 0.0,
-                'knockout_bowling_avg': knockout_matches['bowling_average'].mean() if not knockout_matches.empty else 0.0,
-                'knockout_economy': knockout_matches['economy'].mean() if not knockout_matches.empty else 0.0
+                'pressure_batting_avg': close_agg['batting_average'],
+                'pressure_strike_rate': close_agg['strike_rate'],
+                'chase_batting_avg': chase_agg['batting_average'],
+                'chase_strike_rate': chase_agg['strike_rate'],
+                'knockout_batting_avg': knockout_agg['batting_average'],
+                'knockout_strike_rate': knockout_agg['strike_rate'],
+                'pressure_bowling_avg': close_agg['bowling_average'],
+                'pressure_economy': close_agg['economy'],
+                'knockout_bowling_avg': knockout_agg['bowling_average'],
+                'knockout_economy': knockout_agg['economy']
             }
             
             return metrics
@@ -728,24 +764,40 @@ class DataProcessor:
             self.logger.error(f"Error calculating pressure metrics: {str(e)}")
             return {}
 
+    def _load_match_data(self) -> pd.DataFrame:
+        """Load processed match data once and index rows by player, opponent and venue"""
+        if self._match_data is None:
+            match_data = pd.read_csv(self.data_path / 'processed' / 'match_data.csv', dtype={'result': 'category'})
+            
+            # Map each key to the (sorted) positions of its rows
+            self._match_index = {
+                'player_name': match_data.groupby('player_name', sort=False).indices,
+                'opponent': match_data.groupby('opponent', sort=False).indices,
+                ('player_name', 'opponent'): match_data.groupby(['player_name', 'opponent'], sort=False).indices,
+                ('player_name', 'venue'): match_data.groupby(['player_name', 'venue'], sort=False).indices
+            }
+            self._match_data = match_data
+            
+        return self._match_data
+        
+    def _match_rows(self, keys, value) -> np.ndarray:
+        """Get row positions in match data for a key value (call _load_match_data first)"""
+        return self._match_index[keys].get(value, np.empty(0, dtype=np.intp))
+
     def get_head_to_head_stats(self, player1: str, player2: str) -> Dict:
         """Get head-to-head statistics between two players"""
         try:
             # Load match data
-            match_data = pd.read_csv(self.data_path / 'processed' / 'match_data.csv')
+            match_data = self._load_match_data()
             
             # Get matches where both players played
-            h2h_matches = match_data[
-                ((match_data['player_name'] == player1) & (match_data['opponent'] == player2)) |
-                ((match_data['player_name'] == player2) & (match_data['opponent'] == player1))
-            ]
+            player1_stats = match_data.iloc[self._match_rows(('player_name', 'opponent'), (player1, player2))]
+            player2_stats = match_data.iloc[self._match_rows(('player_name', 'opponent'), (player2, player1))]
             
-            if h2h_matches.empty:
+            if player1_stats.empty and player2_stats.empty:
                 return {}
                 
             # Calculate head-to-head stats
-            player1_stats = h2h_matches[h2h_matches['player_name'] == player1]
-            player2_stats = h2h_matches[h2h_matches['player_name'] == player2]
             
             h2h_stats = {
                 player1: {
@@ -775,31 +827,39 @@ class DataProcessor:
     def validate_data(self, data: Dict) -> bool:
         """Validate data against defined rules"""
         try:
+            # Look up the validation bounds once rather than per player
+            min_runs, max_runs = VALIDATION_RULES['min_runs'], VALIDATION_RULES['max_runs']
+            min_wickets, max_wickets = VALIDATION_RULES['min_wickets'], VALIDATION_RULES['max_wickets']
+            min_strike_rate, max_strike_rate = VALIDATION_RULES['min_strike_rate'], VALIDATION_RULES['max_strike_rate']
+            min_economy_rate, max_economy_rate = VALIDATION_RULES['min_economy_rate'], VALIDATION_RULES['max_economy_rate']
+            
             # Validate player statistics
             for player in data.get('players', []):
                 stats = player.get('recent_stats', {})
+                batting = stats.get('batting', {})
+                bowling = stats.get('bowling', {})
                 
                 # Check runs
-                runs = stats.get('batting', {}).get('runs', 0)
-                if not (VALIDATION_RULES['min_runs'] <= runs <= VALIDATION_RULES['max_runs']):
+                runs = batting.get('runs', 0)
+                if not (min_runs <= runs <= max_runs):
                     logger.warning(f"Invalid runs value: {runs}")
                     return False
                 
                 # Check wickets
-                wickets = stats.get('bowling', {}).get('wickets', 0)
-                if not (VALIDATION_RULES['min_wickets'] <= wickets <= VALIDATION_RULES['max_wickets']):
+                wickets = bowling.get('wickets', 0)
+                if not (min_wickets <= wickets <= max_wickets):
                     logger.warning(f"Invalid wickets value: {wickets}")
                     return False
                 
                 # Check strike rate
-                strike_rate = stats.get('batting', {}).get('strike_rate', 0)
-                if not (VALIDATION_RULES['min_strike_rate'] <= strike_rate <= VALIDATION_RULES['max_strike_rate']):
+                strike_rate = batting.get('strike_rate', 0)
+                if not (min_strike_rate <= strike_rate <= max_strike_rate):
                     logger.warning(f"Invalid strike rate: {strike_rate}")
                     return False
                 
                 # Check economy rate
-                economy_rate = stats.get('bowling', {}).get('economy_rate', 0)
-                if not (VALIDATION_RULES['min_economy_rate'] <= economy_rate <= VALIDATION_RULES['max_economy_rate']):
+                economy_rate = bowling.get('economy_rate', 0)
+                if not (min_economy_rate <= economy_rate <= max_economy_rate):
                     logger.warning(f"Invalid economy rate: {economy_rate}")
                     return False
             
@@ -811,27 +871,32 @@ class DataProcessor:
     def save_processed_data(self, data: Dict, match_id: str):
         """Save processed data to file"""
         try:
-            output_file = self.data_dir / f"processed_match_{match_id}.json"
-            with open(output_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            output_file = self.processed_path / f"processed_match_{match_id}.json"
+            if orjson is not None:
+                # Serialize in one call (also handles numpy values)
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(
+                        data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                    ))
+            else:
+                with open(output_file, 'w') as f:
+                    json.dump(data, f, indent=2)
             logger.info(f"Saved processed data for match {match_id}")
         except Exception as e:
             logger.error(f"Error saving processed data: {e}")
 
-    def get_player_historical_stats(self, player_name: str) -> Dict:
+    def get_player_historical_stats(self, player_name: str) -> Mapping[str, Any]:
         """Get historical statistics for a player from processed data"""
         try:
             # Load processed data
-            data_path = self.processed_path / 'combined_data.csv'
-            if not data_path.exists():
-                logger.error(f"Processed data file not found at {data_path}")
+            data = self._load_combined_data()
+            if data is None:
                 return self._get_default_stats(player_name)
-                
-            data = pd.read_csv(data_path)
             
             # Try to find player with normalized name
             normalized_name = self.normalize_player_name(player_name)
-            player_data = data[data['Player_Name'].apply(self.normalize_player_name) == normalized_name]
+            player_data = data[data['_norm_name'] == normalized_name].drop(columns='_norm_name')
             
             if player_data.empty:
                 logger.warning(f"No historical data found for player {player_name}, using defaults")
@@ -841,24 +906,33 @@ class DataProcessor:
             latest_data = player_data.iloc[-1]
             
             # Format historical stats with proper type conversion
-            historical_stats = {}
-            for col in latest_data.index:
-                try:
-                    value = float(latest_data[col]) if pd.notnull(latest_data[col]) else 0.0
-                    historical_stats[col] = value
-                except (ValueError, TypeError):
-                    historical_stats[col] = 0.0
-            
+            # (non-numeric and missing values become 0.0)
+            historical_stats = pd.to_numeric(latest_data, errors='coerce').fillna(0.0).astype(float).to_dict()
+
             return historical_stats
             
         except Exception as e:
             logger.error(f"Error getting historical stats for {player_name}: {str(e)}")
             return self._get_default_stats(player_name)
             
-    def _get_default_stats(self, player_name: str) -> Dict:
-        """Get default statistics based on player role"""
+    def _load_combined_data(self) -> Optional[pd.DataFrame]:
+        """Load processed combined data once, with player names pre-normalized"""
+        if self._combined_data is None:
+            data_path = self.processed_path / 'combined_data.csv'
+            if not data_path.exists():
+                logger.error(f"Processed data file not found at {data_path}")
+                return None
+                
+            data = pd.read_csv(data_path)
+            data['_norm_name'] = data['Player_Name'].map(self.normalize_player_name)
+            self._combined_data = data
+            
+        return self._combined_data
+            
+    def _get_default_stats(self, player_name: str) -> Mapping[str, Any]:
+        """Get default statistics based on player role (read-only)"""
         role = self.get_player_role(player_name)
-        return self.default_stats[role].copy()
+        return self._default_stats_proxy[role]
 
     def process_raw_data(self):
         """Process raw cricket data to create combined dataset with player statistics."""
@@ -867,61 +941,87 @@ class DataProcessor:
             
             # Load matches and deliveries data
             matches_df = pd.read_csv('data/historical/matches.csv')
-            deliveries_df = pd.read_csv('data/historical/deliveries.csv')
+            deliveries_df = pd.read_csv(
+                'data/historical/deliveries.csv',
+                engine='pyarrow',
+                dtype_backend='pyarrow',
+                usecols=['match_id', 'batter', 'bowler', 'ball', 'batsman_runs', 'total_runs', 'is_wicket']
+            )
             
             # Process deliveries data to get player statistics
             player_stats = {}
             
             # Calculate batting statistics
-            batting_stats = deliveries_df.groupby('batter').agg({
-                'batsman_runs': ['sum', 'count'],
-                'ball': 'count'
-            }).reset_index()
+            # Unsorted, flat groupbys: the outer merge below orders the players
+            batting_stats = deliveries_df.groupby('batter', sort=False, observed=True, as_index=False).agg(
+                Runs_Scored=('batsman_runs', 'sum'),
+                Balls_Faced=('batsman_runs', 'count'),
+                Innings_Batted=('ball', 'count')
+            ).rename(columns={'batter': 'Player_Name'})
             
-            batting_stats.columns = ['Player_Name', 'Runs_Scored', 'Balls_Faced', 'Innings_Batted']
             batting_stats['Batting_Average'] = batting_stats['Runs_Scored'] / batting_stats['Innings_Batted']
             batting_stats['Batting_Strike_Rate'] = (batting_stats['Runs_Scored'] / batting_stats['Balls_Faced']) * 100
             
             # Calculate bowling statistics
-            bowling_stats = deliveries_df.groupby('bowler').agg({
-                'ball': 'count',
-                'total_runs': 'sum',
-                'is_wicket': 'sum'
-            }).reset_index()
-            
-            bowling_stats.columns = ['Player_Name', 'Balls_Bowled', 'Runs_Conceded', 'Wickets']
-            bowling_stats['Bowling_Average'] = bowling_stats['Runs_Conceded'] / bowling_stats['Wickets'].replace(0, 1)
+            bowling_stats = deliveries_df.groupby('bowler', sort=False, observed=True, as_index=False).agg(
+                Balls_Bowled=('ball', 'count'),
+                Runs_Conceded=('total_runs', 'sum'),
+                Wickets=('is_wicket', 'sum')
+            ).rename(columns={'bowler': 'Player_Name'})
+            
+            wickets = bowling_stats['Wickets'].to_numpy(dtype=float)
+            bowling_stats['Bowling_Average'] = bowling_stats['Runs_Conceded'].to_numpy(dtype=float) / np.maximum(wickets, 1)
             bowling_stats['Economy_Rate'] = (bowling_stats['Runs_Conceded'] / (bowling_stats['Balls_Bowled'] / 6))
             
             # Merge batting and bowling statistics
             combined_stats = pd.merge(batting_stats, bowling_stats, on='Player_Name', how='outer').fillna(0)
             
-            # Calculate recent form for each player
-            for player in combined_stats['Player_Name']:
-                # Recent batting form
-                recent_matches = deliveries_df[deliveries_df['batter'] == player].sort_values('match_id').tail(3)
-                recent_runs = recent_matches['batsman_runs'].sum()
-                recent_balls = len(recent_matches)
-                
-                # Recent bowling form
-                recent_bowling = deliveries_df[deliveries_df['bowler'] == player].sort_values('match_id').tail(3)
-                recent_wickets = recent_bowling['is_wicket'].sum()
-                recent_economy = recent_bowling['total_runs'].sum() / (len(recent_bowling) / 6) if len(recent_bowling) > 0 else 0
-                
-                # Add recent form to player stats
-                combined_stats.loc[combined_stats['Player_Name'] == player, 'Recent_Form_Runs'] = recent_runs
-                combined_stats.loc[combined_stats['Player_Name'] == player, 'Recent_Form_SR'] = (recent_runs / recent_balls * 100) if recent_balls > 0 else 0
-                combined_stats.loc[combined_stats['Player_Name'] == player, 'Recent_Form_Wickets'] = recent_wickets
-                combined_stats.loc[combined_stats['Player_Name'] == player, 'Recent_Form_Economy'] = recent_economy
+            # Calculate recent batting and bowling form concurrently (independent aggregations)
+            deliveries_df = deliveries_df.sort_values('match_id', kind='stable')
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                batting_future = executor.submit(
+                    self._recent_form, deliveries_df, 'batter',
+                    runs=('batsman_runs', 'sum'),
+                    balls=('batsman_runs', 'size')
+                )
+                bowling_future = executor.submit(
+                    self._recent_form, deliveries_df, 'bowler',
+                    wickets=('is_wicket', 'sum'),
+                    runs=('total_runs', 'sum'),
+                    balls=('total_runs', 'size')
+                )
+                recent_batting = batting_future.result()
+                recent_bowling = bowling_future.result()
+            
+            # Add recent form to player stats
+            players = combined_stats['Player_Name']
+            recent_runs = players.map(recent_batting['runs']).fillna(0).astype(float)
+            recent_balls = players.map(recent_batting['balls']).fillna(0).astype(float)
+            recent_wickets = players.map(recent_bowling['wickets']).fillna(0).astype(float)
+            bowled_runs = players.map(recent_bowling['runs']).fillna(0).astype(float)
+            bowled_balls = players.map(recent_bowling['balls']).fillna(0).astype(float)
+            
+            combined_stats['Recent_Form_Runs'] = recent_runs
+            combined_stats['Recent_Form_SR'] = (recent_runs / recent_balls * 100).where(recent_balls > 0, 0)
+            combined_stats['Recent_Form_Wickets'] = recent_wickets
+            combined_stats['Recent_Form_Economy'] = (bowled_runs / (bowled_balls / 6)).where(bowled_balls > 0, 0)
             
             # Save processed data
             combined_stats.to_csv('data/processed/combined_data.csv', index=False)
+            self._combined_data = None
             logging.info(f"Successfully processed {len(combined_stats)} players' data")
             
         except Exception as e:
             logging.error(f"Error processing raw data: {str(e)}")
             raise e
 
+    def _recent_form(self, deliveries_df: pd.DataFrame, player_col: str, **aggregations) -> pd.DataFrame:
+        """Aggregate each player's deliveries in their last three matches (deliveries sorted by match_id)"""
+        player_matches = deliveries_df[[player_col, 'match_id']].drop_duplicates()
+        last_matches = player_matches.groupby(player_col, sort=False).tail(3)
+        recent = deliveries_df.merge(last_matches, on=[player_col, 'match_id'])
+        return recent.groupby(player_col).agg(**aggregations)
+
     def get_player_form(self, player_name: str) -> Dict:
         """Get player's recent form data"""
         try:
@@ -988,59 +1088,43 @@ class DataProcessor:
                     'stumpings', 'matches', 'last_updated'
                 ])
                 
-            # Update form for each player
-            for player in match_data.get('players', []):
-                player_name = player['name']
-                
-                # Calculate new stats
-                batting = player['batting']
-                bowling = player['bowling']
-                
-                new_stats = {
-                    'player_name': player_name,
-                    'batting_average': batting['runs'],
-                    'strike_rate': (batting['runs'] / batting['balls'] * 100) if batting['balls'] > 0 else 0,
-                    'runs': batting['runs'],
-                    'wickets': bowling['wickets'],
-                    'economy': (bowling['runs_conceded'] / bowling['overs']) if bowling['overs'] > 0 else 0,
-                    'bowling_average': (bowling['runs_conceded'] / bowling['wickets']) if bowling['wickets'] > 0 else 0,
+            # Build the new match stats for all players at once
+            last_updated = datetime.now().isoformat()
+            new_stats = pd.DataFrame([
+                {
+                    'player_name': player['name'],
+                    'batting_average': player['batting']['runs'],
+                    'strike_rate': (player['batting']['runs'] / player['batting']['balls'] * 100) if player['batting']['balls'] > 0 else 0,
+                    'runs': player['batting']['runs'],
+                    'wickets': player['bowling']['wickets'],
+                    'economy': (player['bowling']['runs_conceded'] / player['bowling']['overs']) if player['bowling']['overs'] > 0 else 0,
+                    'bowling_average': (player['bowling']['runs_conceded'] / player['bowling']['wickets']) if player['bowling']['wickets'] > 0 else 0,
                     'catches': 0,  # Need to add fielding stats
-                    'stumpings': 0,
-                    'matches': 1,
-                    'last_updated': datetime.now().isoformat()
+                    'stumpings': 0
                 }
+                for player in match_data.get('players', [])
+            ])
+            
+            if not new_stats.empty:
+                # Align new stats with existing form; new players have no old row
+                merged = form_data.merge(new_stats, on='player_name', how='right', suffixes=('_old', '_new'))
+                old_matches = pd.to_numeric(merged['matches']).fillna(0).astype(int)
+                matches = old_matches + 1
                 
-                # Update or append player stats
-                if player_name in form_data['player_name'].values:
-                    # Update existing player stats
-                    mask = form_data['player_name'] == player_name
-                    old_stats = form_data[mask].iloc[0]
-                    
-                    # Calculate moving averages
-                    matches = old_stats['matches'] + 1
-                    form_data.loc[mask, 'batting_average'] = (
-                        (old_stats['batting_average'] * old_stats['matches'] + new_stats['batting_average'])
-                        / matches
-                    )
-                    form_data.loc[mask, 'strike_rate'] = (
-                        (old_stats['strike_rate'] * old_stats['matches'] + new_stats['strike_rate'])
-                        / matches
-                    )
-                    form_data.loc[mask, 'runs'] += new_stats['runs']
-                    form_data.loc[mask, 'wickets'] += new_stats['wickets']
-                    form_data.loc[mask, 'economy'] = (
-                        (old_stats['economy'] * old_stats['matches'] + new_stats['economy'])
-                        / matches
-                    )
-                    form_data.loc[mask, 'bowling_average'] = (
-                        (old_stats['bowling_average'] * old_stats['matches'] + new_stats['bowling_average'])
-                        / matches
-                    )
-                    form_data.loc[mask, 'matches'] = matches
-                    form_data.loc[mask, 'last_updated'] = new_stats['last_updated']
-                else:
-                    # Add new player stats
-                    form_data = form_data.append(new_stats, ignore_index=True)
+                updated = pd.DataFrame({'player_name': merged['player_name']})
+                
+                # Calculate moving averages
+                for col in ['batting_average', 'strike_rate', 'economy', 'bowling_average']:
+                    updated[col] = (pd.to_numeric(merged[f'{col}_old']).fillna(0) * old_matches + merged[f'{col}_new']) / matches
+                for col in ['runs', 'wickets', 'catches', 'stumpings']:
+                    updated[col] = pd.to_numeric(merged[f'{col}_old']).fillna(0).astype(int) + merged[f'{col}_new']
+                updated['matches'] = matches
+                updated['last_updated'] = last_updated
+                
+                # Replace rows of updated players and append new ones
+                unchanged = form_data[~form_data['player_name'].isin(updated['player_name'])]
+                updated = updated[form_data.columns]
+                form_data = pd.concat([unchanged, updated], ignore_index=True) if not unchanged.empty else updated
                     
             # Save updated form data
             form_data.to_csv(self.form_data_path, index=False)
@@ -1054,17 +1138,17 @@ class DataProcessor:
         """Get player's performance at specific venues"""
         try:
             # Load match data
-            match_data = pd.read_csv(self.data_path / 'processed' / 'match_data.csv')
+            match_data = self._load_match_data()
             
             # Get player's matches at the venue
-            venue_matches = match_data[
-                (match_data['player_name'] == player_name) &
-                (match_data['venue'] == venue)
-            ]
+            venue_matches = match_data.iloc[self._match_rows(('player_name', 'venue'), (player_name, venue))]
             
             if venue_matches.empty:
                 return {}
                 
+            won = venue_matches['result'].eq('won')
+            lost = venue_matches['result'].eq('lost')
+            
             # Calculate venue-specific stats
             venue_stats = {
                 'matches': len(venue_matches),
@@ -1076,9 +1160,9 @@ class DataProcessor:
                 'bowling_avg': venue_matches['bowling_average'].mean(),
                 'economy': venue_matches['economy'].mean(),
                 'best_bowling': venue_matches['wickets'].max(),
-                'win_rate': (venue_matches['result'] == 'won').mean(),
-                'avg_win_margin': venue_matches[venue_matches['result'] == 'won']['margin'].mean(),
-                'avg_loss_margin': venue_matches[venue_matches['result'] == 'lost']['margin'].mean()
+                'win_rate': won.mean(),
+                'avg_win_margin': venue_matches.loc[won, 'margin'].mean(),
+                'avg_loss_margin': venue_matches.loc[lost, 'margin'].mean()
             }
             
             return venue_stats
@@ -1090,27 +1174,23 @@ class DataProcessor:
     def get_venue_conditions(self, venue: str) -> Dict:
         """Get venue-specific conditions and characteristics"""
         try:
-            # Load venue data
-            venue_data = pd.read_csv(self.data_path / 'processed' / 'venue_data.csv')
-            
-            # Get venue characteristics
-            venue_info = venue_data[venue_data['venue'] == venue].iloc[0]
-            
-            conditions = {
-                'avg_first_innings_score': venue_info['avg_first_innings_score'],
-                'avg_second_innings_score': venue_info['avg_second_innings_score'],
-                'win_rate_batting_first': venue_info['win_rate_batting_first'],
-                'win_rate_chasing': venue_info['win_rate_chasing'],
-                'avg_runs_per_over': venue_info['avg_runs_per_over'],
-                'avg_wickets_per_match': venue_info['avg_wickets_per_match'],
-                'pitch_type': venue_info['pitch_type'],
-                'ground_size': venue_info['ground_size'],
-                'boundary_length': venue_info['boundary_length'],
-                'is_spinner_friendly': venue_info['is_spinner_friendly'],
-                'is_pacer_friendly': venue_info['is_pacer_friendly']
-            }
+            if self._venue_conditions is None:
+                # Load venue data once and index it by venue
+                venue_data = pd.read_csv(self.data_path / 'processed' / 'venue_data.csv')
+                columns = [
+                    'avg_first_innings_score', 'avg_second_innings_score',
+                    'win_rate_batting_first', 'win_rate_chasing',
+                    'avg_runs_per_over', 'avg_wickets_per_match',
+                    'pitch_type', 'ground_size', 'boundary_length',
+                    'is_spinner_friendly', 'is_pacer_friendly'
+                ]
+                self._venue_conditions = (
+                    venue_data.drop_duplicates('venue')
+                    .set_index('venue')[columns]
+                    .to_dict(orient='index')
+                )
             
-            return conditions
+            return self._venue_conditions.get(venue, {})
             
         except Exception as e:
             self.logger.error(f"Error getting venue conditions: {str(e)}")
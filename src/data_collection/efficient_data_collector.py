@@ -1,14 +1,114 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
 import json
+import hashlib
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 import os
 import csv
+import sqlite3
+import threading
 import time
 
+
+def _rolling_means_blocks(values: np.ndarray, group_start: np.ndarray,
+                          group_len: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing rolling mean over contiguous row blocks (one block per player)
+    
+    Equivalent to ``groupby(...).rolling(window, min_periods=1).mean()`` on rows
+    already laid out block by block: NaNs are skipped and a window never crosses
+    into the previous block.
+    
+    Args:
+        values: 2D float array, one column per statistic
+        group_start: First row of each block
+        group_len: Number of rows in each block
+        window: Rolling window size
+        
+    Returns:
+        Array of rolling means with the same shape as ``values``
+    """
+    n = values.shape[0]
+    valid = ~np.isnan(values)
+    
+    # Prefix sums with a leading zero row so that sum(values[a:b]) = csum[b] - csum[a]
+    csum = np.zeros((n + 1, values.shape[1]))
+    np.cumsum(np.where(valid, values, 0.0), axis=0, out=csum[1:])
+    ccount = np.zeros((n + 1, values.shape[1]))
+    np.cumsum(valid, axis=0, out=ccount[1:])
+    
+    # Window start for each row, clamped to the start of its block
+    rows = np.arange(n)
+    lower = np.maximum(rows - window + 1, np.repeat(group_start, group_len))
+    
+    sums = csum[rows + 1] - csum[lower]
+    counts = ccount[rows + 1] - ccount[lower]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+def _block_means_stds(values: np.ndarray, group_start: np.ndarray,
+                      group_len: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean and sample standard deviation of each contiguous row block
+    
+    Matches ``groupby(...).mean()`` and ``groupby(...).std()`` on rows already
+    laid out block by block: NaNs are skipped and blocks with fewer than two
+    values have a NaN standard deviation.
+    
+    Args:
+        values: 2D float array, one column per statistic
+        group_start: First row of each block
+        group_len: Number of rows in each block
+        
+    Returns:
+        Tuple of (means, standard deviations), one row per block
+    """
+    n_columns = values.shape[1]
+    if values.shape[0] == 0:
+        empty = np.full((len(group_start), n_columns), np.nan)
+        return empty, empty.copy()
+    
+    valid = ~np.isnan(values)
+    counts = np.add.reduceat(valid, group_start, axis=0).astype(np.float64)
+    sums = np.add.reduceat(np.where(valid, values, 0.0), group_start, axis=0)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+        
+        # Second pass over the deviations from each block's mean
+        deviations = np.where(valid, values - np.repeat(means, group_len, axis=0), 0.0)
+        squares = np.add.reduceat(deviations * deviations, group_start, axis=0)
+        stds = np.sqrt(squares / (counts - 1))
+    
+    stds[counts < 2] = np.nan
+    return means, stds
+
+
+class _LRUCache(OrderedDict):
+    """Dictionary holding at most ``maxsize`` entries, evicting the least recently used"""
+    
+    def __init__(self, maxsize: int = 512):
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 class EfficientDataCollector:
     """
     Efficient data collection system that minimizes API calls by:
@@ -16,6 +116,19 @@ class EfficientDataCollector:
     2. Implementing smart caching and update strategies
     3. Combining multiple data sources for comprehensive player information
     """
+    
+    # Player statistics copied into the prediction features, with defaults
+    _PLAYER_STAT_DEFAULTS = {
+        'last_5_matches_runs_avg': 0,
+        'last_5_matches_wickets_avg': 0,
+        'last_5_matches_sr_avg': 0,
+        'last_5_matches_er_avg': 0,
+        'career_runs_avg': 0,
+        'career_wickets_avg': 0,
+        'career_sr_avg': 0,
+        'career_er_avg': 0
+    }
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.base_path = Path(__file__).parent.parent.parent
@@ -31,14 +144,28 @@ class EfficientDataCollector:
         for path in [self.processed_path, self.cache_path, self.updates_path]:
             path.mkdir(parents=True, exist_ok=True)
         
-        # Initialize data caches
-        self.player_cache = {}
-        self.team_cache = {}
-        self.match_cache = {}
-        self.venue_cache = {}
+        # Initialize data caches (bounded, for long-running processes);
+        # player entries are (data, last update time) pairs
+        self.player_cache = _LRUCache(maxsize=512)
+        self.team_cache = _LRUCache(maxsize=64)
+        self.match_cache = _LRUCache(maxsize=128)
+        self.venue_cache = _LRUCache(maxsize=64)
+        self._historical_latest: Optional[Dict[str, Dict[str, float]]] = None
+        self._historical_latest_time = None
+        self._updates_index = {}
+        self._schedule_index = None
+        
+        # Persistent player cache, one row per player; the connection is
+        # shared across threads, so every use goes through the lock
+        self._kv = sqlite3.connect(self.cache_path / 'kv.db', check_same_thread=False)
+        self._kv_lock = threading.Lock()
+        self._kv.execute(
+            'CREATE TABLE IF NOT EXISTS player_cache (name TEXT PRIMARY KEY, data TEXT)'
+        )
         
         # Load IPL 2025 data
         self.ipl_data = self._load_ipl_data()
+        self._player_to_team, self._team_player_names = self._index_team_players()
         
         # Set up update tracking
         self.last_update_time = {}
@@ -51,6 +178,17 @@ class EfficientDataCollector:
             'weather_data': timedelta(hours=3)
         }
     
+    def close(self):
+        """Close the persistent player cache"""
+        with self._kv_lock:
+            self._kv.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def _load_ipl_data(self):
         """Load IPL 2025 schedule and team data"""
         try:
@@ -60,6 +198,27 @@ class EfficientDataCollector:
             self.logger.error("Failed to import IPL2025Data. Using empty data.")
             return None
     
+    def _index_team_players(self) -> Tuple[Dict[str, Tuple[str, str, Any]], Dict[str, frozenset]]:
+        """
+        Index the IPL 2025 squads by player name
+        
+        Returns:
+            Tuple of (player name -> (team, role, price), team -> player names)
+        """
+        if self.ipl_data is None:
+            return {}, {}
+        
+        player_to_team = {
+            player['name']: (team_name, player['role'], player['price'])
+            for team_name, team_info in self.ipl_data.teams.items()
+            for player in team_info.get('players', [])
+        }
+        team_player_names = {
+            team_name: frozenset(player['name'] for player in team_info.get('players', []))
+            for team_name, team_info in self.ipl_data.teams.items()
+        }
+        return player_to_team, team_player_names
+    
     def load_historical_data(self) -> pd.DataFrame:
         """
         Load and process historical IPL data from CSV files
@@ -68,11 +227,11 @@ class EfficientDataCollector:
             DataFrame containing processed historical data
         """
         try:
-            # Check if processed data already exists
-            processed_file = self.processed_path / 'historical_data_processed.csv'
-            if processed_file.exists():
+            # Check if processed data already exists for the current raw data
+            processed_file = self._get_historical_parquet()
+            if processed_file is not None:
                 self.logger.info(f"Loading processed historical data from {processed_file}")
-                return pd.read_csv(processed_file)
+                return pd.read_parquet(processed_file)
             
             # Load raw historical data
             matches_file = self.historical_path / 'ipl_matches_2008_2023.csv'
@@ -93,8 +252,12 @@ class EfficientDataCollector:
             # Process and merge data
             processed_data = self._process_historical_data(matches_data, player_stats)
             
-            # Save processed data
-            processed_data.to_csv(processed_file, index=False)
+            # Save processed data, replacing files built from older raw data
+            processed_file = self._historical_parquet_path()
+            for stale_file in self.processed_path.glob('historical_processed_*.parquet'):
+                stale_file.unlink()
+            processed_data.to_parquet(processed_file, engine='pyarrow', compression='zstd', index=False)
+            self.last_update_time['historical'] = datetime.now()
             self.logger.info(f"Saved processed historical data to {processed_file}")
             
             return processed_data
@@ -118,13 +281,15 @@ class EfficientDataCollector:
         if 'Player' in player_stats.columns:
             player_stats = player_stats.rename(columns={'Player': 'player'})
         
-        # Merge matches and player stats
-        merged_data = pd.merge(
-            player_stats,
-            matches_data,
+        # Merge matches and player stats (left join against the match_id index)
+        merged_data = player_stats.join(
+            matches_data.set_index('match_id'),
             on='match_id',
-            how='left'
+            how='left',
+            lsuffix='_x',
+            rsuffix='_y'
         )
+        merged_data.index = pd.RangeIndex(len(merged_data))
         
         # Calculate derived features
         processed_data = self._calculate_derived_features(merged_data)
@@ -141,83 +306,97 @@ class EfficientDataCollector:
         Returns:
             DataFrame with additional derived features
         """
-        # Make a copy to avoid modifying the original
-        df = data.copy()
+        # New columns are collected here and attached in a single assign at the
+        # end, so the input is never modified and never copied up front
+        df = data
+        new_cols = {}
         
-        # Sort by date for time-based calculations
+        # Order rows by player, then by date for time-based calculations, so
+        # each player's matches form one contiguous block
+        codes, _ = pd.factorize(df['player_id'])
         if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.sort_values('date')
+            dates = pd.to_datetime(df['date'])
+            # Integer epoch key, with missing dates last as in a date sort
+            date_key = np.where(dates.isna().to_numpy(), np.iinfo(np.int64).max,
+                                dates.to_numpy().view('i8'))
+            order = np.lexsort((date_key, codes))
+            new_cols['date'] = dates.take(order).array
+        else:
+            order = np.argsort(codes, kind='stable')
+        df = df.take(order)
+        codes = codes[order]
         
         # Calculate rolling averages for each player
-        player_groups = df.groupby('player_id')
-        
-        # Last 5 matches stats
-        df['last_5_matches_runs_avg'] = player_groups['runs'].transform(
-            lambda x: x.rolling(5, min_periods=1).mean()
-        )
-        
-        df['last_5_matches_wickets_avg'] = player_groups['wickets'].transform(
-            lambda x: x.rolling(5, min_periods=1).mean()
-        )
+        stat_cols = ['runs', 'wickets', 'strike_rate', 'economy_rate']
+        stat_names = ['runs', 'wickets', 'sr', 'er']
         
-        df['last_5_matches_sr_avg'] = player_groups['strike_rate'].transform(
-            lambda x: x.rolling(5, min_periods=1).mean()
-        )
+        block_start = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        block_len = np.diff(np.r_[block_start, len(codes)])
+        values = np.ascontiguousarray(df[stat_cols].to_numpy(dtype=np.float64))
         
-        df['last_5_matches_er_avg'] = player_groups['economy_rate'].transform(
-            lambda x: x.rolling(5, min_periods=1).mean()
-        )
+        # Last 5 and last 10 matches stats (all stat columns per rolling pass)
+        for window in [5, 10]:
+            rolling_means = _rolling_means_blocks(
+                values, block_start, block_len, window
+            ).astype(np.float32)
+            # Rows without a player_id are not part of any group
+            rolling_means[codes < 0] = np.nan
+            for i, name in enumerate(stat_names):
+                new_cols[f'last_{window}_matches_{name}_avg'] = rolling_means[:, i]
         
-        # Last 10 matches stats
-        df['last_10_matches_runs_avg'] = player_groups['runs'].transform(
-            lambda x: x.rolling(10, min_periods=1).mean()
-        )
+        # Career averages and spread, one value per player block repeated
+        # over the block's rows
+        block_means, block_stds = _block_means_stds(values, block_start, block_len)
+        career_means = np.repeat(block_means.astype(np.float32), block_len, axis=0)
+        career_stds = np.repeat(block_stds.astype(np.float32), block_len, axis=0)
+        career_means[codes < 0] = np.nan
+        career_stds[codes < 0] = np.nan
         
-        df['last_10_matches_wickets_avg'] = player_groups['wickets'].transform(
-            lambda x: x.rolling(10, min_periods=1).mean()
-        )
+        new_cols['career_runs_avg'] = career_means[:, 0]
+        new_cols['career_wickets_avg'] = career_means[:, 1]
+        new_cols['career_sr_avg'] = career_means[:, 2]
+        new_cols['career_er_avg'] = career_means[:, 3]
         
-        df['last_10_matches_sr_avg'] = player_groups['strike_rate'].transform(
-            lambda x: x.rolling(10, min_periods=1).mean()
-        )
-        
-        df['last_10_matches_er_avg'] = player_groups['economy_rate'].transform(
-            lambda x: x.rolling(10, min_periods=1).mean()
-        )
-        
-        # Career averages
-        df['career_runs_avg'] = player_groups['runs'].transform('mean')
-        df['career_wickets_avg'] = player_groups['wickets'].transform('mean')
-        df['career_sr_avg'] = player_groups['strike_rate'].transform('mean')
-        df['career_er_avg'] = player_groups['economy_rate'].transform('mean')
+        # Only divide where there is a positive career average; other rows keep
+        # their default instead of computing a discarded quotient
+        career_runs_avg = new_cols['career_runs_avg']
+        has_career_runs = career_runs_avg > 0
         
         # Form factor (recent performance vs career average)
-        df['form_factor'] = np.where(
-            df['career_runs_avg'] > 0,
-            df['last_5_matches_runs_avg'] / df['career_runs_avg'],
-            1.0
-        )
+        form_factor = np.ones_like(career_runs_avg)
+        np.divide(new_cols['last_5_matches_runs_avg'], career_runs_avg,
+                  out=form_factor, where=has_career_runs)
+        new_cols['form_factor'] = form_factor
         
         # Consistency score (based on standard deviation of performance)
-        df['runs_std'] = player_groups['runs'].transform('std')
-        df['consistency_score'] = np.where(
-            df['career_runs_avg'] > 0,
-            1 - (df['runs_std'] / df['career_runs_avg']).clip(0, 1),
-            0.5
-        )
+        new_cols['runs_std'] = career_stds[:, 0]
+        consistency_score = np.full_like(career_runs_avg, 0.5)
+        np.divide(new_cols['runs_std'], career_runs_avg,
+                  out=consistency_score, where=has_career_runs)
+        np.clip(consistency_score, 0, 1, out=consistency_score)
+        np.subtract(1, consistency_score, out=consistency_score, where=has_career_runs)
+        new_cols['consistency_score'] = consistency_score
         
         # Player role indicators
-        df['is_batsman'] = np.where(df['player_role'].str.contains('Batsman', na=False), 1, 0)
-        df['is_bowler'] = np.where(df['player_role'].str.contains('Bowler', na=False), 1, 0)
-        df['is_all_rounder'] = np.where(df['player_role'].str.contains('All-rounder', na=False), 1, 0)
-        df['is_wicket_keeper'] = np.where(df['player_role'].str.contains('Wicket', na=False), 1, 0)
+        role = df['player_role'].astype('string[pyarrow]').fillna('')
+        new_cols['is_batsman'] = role.str.contains('Batsman', regex=False).astype('int8')
+        new_cols['is_bowler'] = role.str.contains('Bowler', regex=False).astype('int8')
+        new_cols['is_all_rounder'] = role.str.contains('All-rounder', regex=False).astype('int8')
+        new_cols['is_wicket_keeper'] = role.str.contains('Wicket', regex=False).astype('int8')
         
         # Match context
-        df['is_home_match'] = np.where(df['team'] == df['home_team'], 1, 0)
+        new_cols['is_home_match'] = (df['team'] == df['home_team']).to_numpy(dtype=np.int8)
         
-        # Fill any remaining NaN values
-        df = df.fillna(0)
+        df = df.assign(**new_cols)
+        
+        # Fill missing derived statistics (rows without a player_id, players
+        # with a single match, windows with no values); role and match context
+        # flags are never missing and input columns are left as they are
+        df.fillna({
+            col: 0 for col in new_cols
+            if col.startswith(('last_', 'career_'))
+            or col in ('form_factor', 'runs_std', 'consistency_score')
+        }, inplace=True)
         
         return df
     
@@ -235,18 +414,16 @@ class EfficientDataCollector:
         try:
             # Check cache first
             if player_name in self.player_cache:
-                player_data = self.player_cache[player_name]
+                player_data, last_update = self.player_cache[player_name]
                 
                 # Check if update is needed
-                last_update = self.last_update_time.get(f"player_{player_name}", datetime.min)
                 if (datetime.now() - last_update) < self.update_frequencies['player_stats']:
                     return player_data
             
             # Need to load or update data
             if update_if_needed:
                 player_data = self._update_player_data(player_name)
-                self.player_cache[player_name] = player_data
-                self.last_update_time[f"player_{player_name}"] = datetime.now()
+                self.player_cache[player_name] = (player_data, datetime.now())
                 return player_data
             
             # No data available and not updating
@@ -267,13 +444,11 @@ class EfficientDataCollector:
             Updated player data dictionary
         """
         # Check if we have cached data first
-        cache_file = self.cache_path / f"player_{player_name.replace(' ', '_')}.json"
-        player_data = {}
-        
-        if cache_file.exists():
-            # Load cached data
-            with open(cache_file, 'r') as f:
-                player_data = json.load(f)
+        with self._kv_lock:
+            row = self._kv.execute(
+                'SELECT data FROM player_cache WHERE name = ?', (player_name,)
+            ).fetchone()
+        player_data = json.loads(row[0]) if row else {}
         
         # Supplement with historical data
         historical_data = self._get_player_historical_data(player_name)
@@ -281,13 +456,9 @@ class EfficientDataCollector:
             player_data.update(historical_data)
         
         # Add team information
-        for team_name, team_info in self.ipl_data.teams.items():
-            for player in team_info['players']:
-                if player['name'] == player_name:
-                    player_data['current_team'] = team_name
-                    player_data['role'] = player['role']
-                    player_data['price'] = player['price']
-                    break
+        team_entry = self._player_to_team.get(player_name)
+        if team_entry is not None:
+            player_data['current_team'], player_data['role'], player_data['price'] = team_entry
         
         # Add injury information
         injury_data = self._get_player_injury_data(player_name)
@@ -300,8 +471,12 @@ class EfficientDataCollector:
             player_data['recent_form'] = recent_form
         
         # Save updated data to cache
-        with open(cache_file, 'w') as f:
-            json.dump(player_data, f, indent=4)
+        data = json.dumps(player_data)
+        with self._kv_lock, self._kv:
+            self._kv.execute(
+                'INSERT OR REPLACE INTO player_cache (name, data) VALUES (?, ?)',
+                (player_name, data)
+            )
         
         return player_data
     
@@ -315,26 +490,16 @@ class EfficientDataCollector:
         Returns:
             Dictionary with historical statistics
         """
-        # Load processed historical data
-        historical_file = self.processed_path / 'historical_data_processed.csv'
-        if not historical_file.exists():
-            return {}
-        
-        # Load only the player's data to save memory
-        player_data = pd.read_csv(historical_file, usecols=lambda col: col in [
-            'player_name', 'runs', 'wickets', 'strike_rate', 'economy_rate',
-            'career_runs_avg', 'career_wickets_avg', 'career_sr_avg', 'career_er_avg',
-            'last_5_matches_runs_avg', 'last_5_matches_wickets_avg',
-            'last_5_matches_sr_avg', 'last_5_matches_er_avg'
-        ])
-        
-        player_data = player_data[player_data['player_name'] == player_name]
-        
-        if player_data.empty:
-            return {}
+        # Rebuild the per-player lookup after the processed data is rewritten
+        historical_time = self.last_update_time.get('historical')
+        if self._historical_latest is None or self._historical_latest_time != historical_time:
+            self._historical_latest = self._load_historical_latest()
+            self._historical_latest_time = historical_time
         
         # Get the latest record
-        latest_record = player_data.iloc[-1].to_dict()
+        latest_record = self._historical_latest.get(player_name)
+        if not latest_record:
+            return {}
         
         # Extract relevant fields
         return {
@@ -348,6 +513,116 @@ class EfficientDataCollector:
             'last_5_matches_er_avg': latest_record.get('last_5_matches_er_avg', 0)
         }
     
+    def _load_historical_latest(self) -> Dict[str, Dict[str, float]]:
+        """
+        Load the latest processed historical record of every player
+        
+        Returns:
+            Dictionary mapping player name to their latest statistics
+        """
+        columns = [
+            'player_name', 'runs', 'wickets', 'strike_rate', 'economy_rate',
+            'career_runs_avg', 'career_wickets_avg', 'career_sr_avg', 'career_er_avg',
+            'last_5_matches_runs_avg', 'last_5_matches_wickets_avg',
+            'last_5_matches_sr_avg', 'last_5_matches_er_avg'
+        ]
+        
+        # Load only the needed columns, once for all players
+        try:
+            parquet_file = self._get_historical_parquet()
+            if parquet_file is None:
+                return {}
+            dataset = ds.dataset(parquet_file, format='parquet')
+            historical_data = dataset.to_table(
+                columns=[col for col in columns if col in dataset.schema.names]
+            )
+        except (pa.ArrowException, OSError) as e:
+            self.logger.error(f"Error reading processed historical data: {str(e)}")
+            return {}
+        
+        if 'player_name' not in historical_data.column_names:
+            return {}
+        
+        return (
+            historical_data.to_pandas()
+            .groupby('player_name')
+            .tail(1)
+            .set_index('player_name')
+            .to_dict(orient='index')
+        )
+    
+    def _historical_parquet_path(self) -> Optional[Path]:
+        """
+        Get the processed historical data path for the current raw data, named
+        by a hash of the raw files' modification times
+        
+        Returns:
+            Path to the Parquet file, or None if the raw data is missing
+        """
+        matches_file = self.historical_path / 'ipl_matches_2008_2023.csv'
+        player_stats_file = self.historical_path / 'player_stats.csv'
+        if not matches_file.exists() or not player_stats_file.exists():
+            return None
+        
+        key = hashlib.sha256(
+            f"{matches_file.stat().st_mtime_ns}:{player_stats_file.stat().st_mtime_ns}".encode()
+        ).hexdigest()[:16]
+        return self.processed_path / f'historical_processed_{key}.parquet'
+    
+    def _get_historical_parquet(self) -> Optional[Path]:
+        """
+        Get the processed historical data file, if it is up to date with the
+        raw data (or the latest one written, when the raw data is missing)
+        
+        Returns:
+            Path to the Parquet file, or None if there is no usable processed data
+        """
+        parquet_file = self._historical_parquet_path()
+        if parquet_file is None:
+            processed_files = sorted(
+                self.processed_path.glob('historical_processed_*.parquet'),
+                key=lambda path: path.stat().st_mtime
+            )
+            return processed_files[-1] if processed_files else None
+        return parquet_file if parquet_file.exists() else None
+    
+    def _load_updates_index(self, file_name: str, key_field) -> Optional[Dict[Any, Dict[str, Any]]]:
+        """
+        Load a JSON updates file and index its records by key, re-reading the
+        file only when its modification time changes
+        
+        Args:
+            file_name: Name of the file in the updates directory
+            key_field: Record field, or tuple of fields, to index by (first
+                record wins on duplicates)
+            
+        Returns:
+            Dictionary mapping key to record, or None if the file does not exist
+        """
+        updates_file = self.updates_path / file_name
+        try:
+            mtime = updates_file.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        
+        cached = self._updates_index.get(file_name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with open(updates_file, 'r') as f:
+            records = json.load(f)
+        
+        index = {}
+        for record in records:
+            if isinstance(key_field, tuple):
+                key = tuple(record.get(field) for field in key_field)
+            else:
+                key = record.get(key_field)
+            index.setdefault(key, record)
+        
+        self._updates_index[file_name] = (mtime, index)
+        return index
+    
     def _get_player_injury_data(self, player_name: str) -> Dict[str, Any]:
         """
         Get player injury data from local storage
@@ -358,24 +633,21 @@ class EfficientDataCollector:
         Returns:
             Dictionary with injury information
         """
-        # Check for injury updates file
-        injury_file = self.updates_path / 'injury_updates.json'
-        if not injury_file.exists():
-            return {}
-        
         try:
-            with open(injury_file, 'r') as f:
-                injury_data = json.load(f)
+            # Check for injury updates file
+            injury_data = self._load_updates_index('injury_updates.json', 'player_name')
+            if injury_data is None:
+                return {}
             
             # Find player's injury data
-            for player_injury in injury_data:
-                if player_injury.get('player_name') == player_name:
-                    return {
-                        'is_injured': player_injury.get('is_injured', False),
-                        'injury_type': player_injury.get('injury_type', ''),
-                        'expected_recovery': player_injury.get('expected_recovery', ''),
-                        'last_updated': player_injury.get('last_updated', '')
-                    }
+            player_injury = injury_data.get(player_name)
+            if player_injury is not None:
+                return {
+                    'is_injured': player_injury.get('is_injured', False),
+                    'injury_type': player_injury.get('injury_type', ''),
+                    'expected_recovery': player_injury.get('expected_recovery', ''),
+                    'last_updated': player_injury.get('last_updated', '')
+                }
             
             # No injury data found
             return {
@@ -398,22 +670,14 @@ class EfficientDataCollector:
         Returns:
             Dictionary with recent form information
         """
-        # Check for recent form file
-        form_file = self.updates_path / 'recent_form.json'
-        if not form_file.exists():
-            return {}
-        
         try:
-            with open(form_file, 'r') as f:
-                form_data = json.load(f)
+            # Check for recent form file
+            form_data = self._load_updates_index('recent_form.json', 'player_name')
+            if form_data is None:
+                return {}
             
             # Find player's form data
-            for player_form in form_data:
-                if player_form.get('player_name') == player_name:
-                    return player_form
-            
-            # No form data found
-            return {}
+            return form_data.get(player_name, {})
             
         except Exception as e:
             self.logger.error(f"Error reading form data: {str(e)}")
@@ -431,11 +695,11 @@ class EfficientDataCollector:
         """
         try:
             # Find match in schedule
-            match_data = None
-            for match in self.ipl_data.schedule:
-                if match.get('match_no') == match_no:
-                    match_data = match
-                    break
+            if self._schedule_index is None:
+                self._schedule_index = {}
+                for match in self.ipl_data.schedule:
+                    self._schedule_index.setdefault(match.get('match_no'), match)
+            match_data = self._schedule_index.get(match_no)
             
             if not match_data:
                 self.logger.error(f"Match {match_no} not found in schedule")
@@ -449,7 +713,7 @@ class EfficientDataCollector:
             team2_data = self.get_team_data(team2_name)
             
             # Enhance with venue data
-            venue_name = match_data.get('venue').split(',')[0].strip()
+            venue_name = match_data.get('venue').split(',', 1)[0].strip()
             venue_data = self.get_venue_data(venue_name)
             
             # Combine all data
@@ -458,6 +722,7 @@ class EfficientDataCollector:
                 'date': match_data.get('date'),
                 'time': match_data.get('time'),
                 'venue': match_data.get('venue'),
+                'venue_name': venue_name,
                 'team1': {
                     'name': team1_name,
                     'data': team1_data
@@ -527,22 +792,14 @@ class EfficientDataCollector:
         Returns:
             Dictionary with recent performance information
         """
-        # Check for team performance file
-        performance_file = self.updates_path / 'team_performance.json'
-        if not performance_file.exists():
-            return {}
-        
         try:
-            with open(performance_file, 'r') as f:
-                performance_data = json.load(f)
+            # Check for team performance file
+            performance_data = self._load_updates_index('team_performance.json', 'team_name')
+            if performance_data is None:
+                return {}
             
             # Find team's performance data
-            for team_performance in performance_data:
-                if team_performance.get('team_name') == team_name:
-                    return team_performance
-            
-            # No performance data found
-            return {}
+            return performance_data.get(team_name, {})
             
         except Exception as e:
             self.logger.error(f"Error reading team performance data: {str(e)}")
@@ -564,19 +821,12 @@ class EfficientDataCollector:
                 return self.venue_cache[venue_name]
             
             # Check for venue data file
-            venue_file = self.updates_path / 'venue_conditions.json'
-            if not venue_file.exists():
+            venue_data = self._load_updates_index('venue_conditions.json', 'name')
+            if venue_data is None:
                 return {}
             
-            with open(venue_file, 'r') as f:
-                venue_data = json.load(f)
-            
             # Find venue data
-            venue_info = {}
-            for venue in venue_data:
-                if venue.get('name') == venue_name:
-                    venue_info = venue
-                    break
+            venue_info = venue_data.get(venue_name, {})
             
             # Cache the data
             self.venue_cache[venue_name] = venue_info
@@ -598,23 +848,14 @@ class EfficientDataCollector:
         Returns:
             Dictionary with weather information
         """
-        # Check for weather data file
-        weather_file = self.updates_path / 'weather_data.json'
-        if not weather_file.exists():
-            return {}
-        
         try:
-            with open(weather_file, 'r') as f:
-                weather_data = json.load(f)
+            # Check for weather data file
+            weather_data = self._load_updates_index('weather_data.json', ('venue', 'date'))
+            if weather_data is None:
+                return {}
             
             # Find weather data for venue and date
-            for weather in weather_data:
-                if (weather.get('venue') == venue_name and 
-                    weather.get('date') == match_date):
-                    return weather
-            
-            # No weather data found
-            return {}
+            return weather_data.get((venue_name, match_date), {})
             
         except Exception as e:
             self.logger.error(f"Error reading weather data: {str(e)}")
@@ -646,8 +887,8 @@ class EfficientDataCollector:
             player_team = None
             opposition_team = None
             
-            team1_players = [p['name'] for p in match_data['team1']['data'].get('players', [])]
-            team2_players = [p['name'] for p in match_data['team2']['data'].get('players', [])]
+            team1_players = self._team_player_names.get(match_data['team1']['name'], frozenset())
+            team2_players = self._team_player_names.get(match_data['team2']['name'], frozenset())
             
             if player_name in team1_players:
                 player_team = match_data['team1']['name']
@@ -659,88 +900,138 @@ class EfficientDataCollector:
                 self.logger.warning(f"Player {player_name} not found in either team for match {match_no}")
                 return {}
             
-            # Get venue data
-            venue_data = match_data.get('venue_data', {})
-            
-            # Prepare prediction features
-            prediction_data = {
-                # Player identification
-                'player_name': player_name,
-                'team': player_team,
-                'opposition': opposition_team,
-                'venue': match_data.get('venue', '').split(',')[0].strip(),
-                'match_date': match_data.get('date', ''),
+            return self._build_prediction_data(
+                match_no, match_data, player_name, player_data, player_team, opposition_team
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Error preparing prediction data: {str(e)}")
+            return {}
+    
+    def prepare_prediction_data_batch(self, match_no: int) -> pd.DataFrame:
+        """
+        Prepare prediction data for every player of both teams in a match,
+        building the match data only once
+        
+        Args:
+            match_no: Match number in the IPL 2025 schedule
+            
+        Returns:
+            DataFrame with one row of prediction features per player
+        """
+        try:
+            # Get match data
+            match_data = self.get_match_data(match_no)
+            if not match_data:
+                return pd.DataFrame()
+            
+            rows = []
+            for team_key, opposition_key in (('team1', 'team2'), ('team2', 'team1')):
+                player_team = match_data[team_key]['name']
+                opposition_team = match_data[opposition_key]['name']
                 
-                # Player's recent performance
-                'last_5_matches_runs_avg': player_data.get('last_5_matches_runs_avg', 0),
-                'last_5_matches_wickets_avg': player_data.get('last_5_matches_wickets_avg', 0),
-                'last_5_matches_sr_avg': player_data.get('last_5_matches_sr_avg', 0),
-                'last_5_matches_er_avg': player_data.get('last_5_matches_er_avg', 0),
+                for player in match_data[team_key]['data'].get('players', []):
+                    player_data = self.get_player_data(player['name'])
+                    if not player_data:
+                        continue
+                    rows.append(self._build_prediction_data(
+                        match_no, match_data, player['name'], player_data,
+                        player_team, opposition_team
+                    ))
+            
+            return pd.DataFrame(rows)
+            
+        except Exception as e:
+            self.logger.error(f"Error preparing prediction data for match {match_no}: {str(e)}")
+            return pd.DataFrame()
+    
+    def _build_prediction_data(self, match_no: int, match_data: Dict[str, Any], player_name: str,
+                               player_data: Dict[str, Any], player_team: str,
+                               opposition_team: str) -> Dict[str, Any]:
+        """
+        Build the prediction features for one player in a match
+        
+        Args:
+            match_no: Match number in the IPL 2025 schedule
+            match_data: Comprehensive match data from get_match_data
+            player_name: Name of the player
+            player_data: Player data from get_player_data
+            player_team: Name of the player's team
+            opposition_team: Name of the opposition team
+        
+        Returns:
+            Dictionary with all features needed for prediction
+        """
+        # Get venue, weather and team performance data
+        venue_name = match_data['venue_name']
+        venue_data = match_data.get('venue_data', {})
+        weather = match_data.get('weather', {})
+        home_ground = self.ipl_data.teams.get(player_team, {}).get('home_ground', '')
+        
+        team1_performance = match_data['team1']['data'].get('recent_performance', {})
+        team2_performance = match_data['team2']['data'].get('recent_performance', {})
+        if player_team == match_data['team1']['name']:
+            team_performance, opposition_performance = team1_performance, team2_performance
+        else:
+            team_performance, opposition_performance = team2_performance, team1_performance
+        
+        # Player details
+        role = player_data.get('role', '')
+        recent_form = player_data.get('recent_form', {})
+        injury_status = player_data.get('injury_status', {})
+        player_stats = {
+            key: player_data.get(key, default)
+            for key, default in self._PLAYER_STAT_DEFAULTS.items()
+        }
+        
+        # Prepare prediction features
+        prediction_data = {
+            # Player identification
+            'player_name': player_name,
+            'team': player_team,
+            'opposition': opposition_team,
+            'venue': venue_name,
+            'match_date': match_data.get('date', ''),
                 
-                # Player's career stats
-                'career_runs_avg': player_data.get('career_runs_avg', 0),
-                'career_wickets_avg': player_data.get('career_wickets_avg', 0),
-                'career_sr_avg': player_data.get('career_sr_avg', 0),
-                'career_er_avg': player_data.get('career_er_avg', 0),
+            # Player's recent performance and career stats
+            **player_stats,
                 
-                # Player's role
-                'is_batsman': 1 if 'Batsman' in player_data.get('role', '') else 0,
-                'is_bowler': 1 if 'Bowler' in player_data.get('role', '') else 0,
-                'is_all_rounder': 1 if 'All-rounder' in player_data.get('role', '') else 0,
-                'is_wicket_keeper': 1 if 'WK' in player_data.get('role', '') else 0,
+            # Player's role
+            'is_batsman': 1 if 'Batsman' in role else 0,
+            'is_bowler': 1 if 'Bowler' in role else 0,
+            'is_all_rounder': 1 if 'All-rounder' in role else 0,
+            'is_wicket_keeper': 1 if 'WK' in role else 0,
                 
-                # Player's form and fitness
-                'form_factor': player_data.get('recent_form', {}).get('form_factor', 1.0),
-                'consistency_score': player_data.get('recent_form', {}).get('consistency_score', 0.5),
-                'days_since_last_injury': player_data.get('injury_status', {}).get('days_since_last_injury', 30),
-                'is_fully_fit': player_data.get('injury_status', {}).get('is_fully_fit', True),
+            # Player's form and fitness
+            'form_factor': recent_form.get('form_factor', 1.0),
+            'consistency_score': recent_form.get('consistency_score', 0.5),
+            'days_since_last_injury': injury_status.get('days_since_last_injury', 30),
+            'is_fully_fit': injury_status.get('is_fully_fit', True),
                 
-                # Match context
-                'is_home_match': 1 if match_data.get('venue', '').split(',')[0].strip() == 
-                                 self.ipl_data.teams.get(player_team, {}).get('home_ground', '') else 0,
-                'is_day_match': 1 if match_data.get('time', '') < '17:00' else 0,
-                'is_knockout_match': 1 if match_no > 70 else 0,  # Playoff matches are after match 70
+            # Match context
+            'is_home_match': 1 if venue_name == home_ground else 0,
+            'is_day_match': 1 if match_data.get('time', '') < '17:00' else 0,
+            'is_knockout_match': 1 if match_no > 70 else 0,  # Playoff matches are after match 70
                 
-                # Venue statistics
-                'venue_avg_first_innings_score': venue_data.get('avg_first_innings_score', 160),
-                'venue_avg_second_innings_score': venue_data.get('avg_second_innings_score', 150),
-                'venue_avg_wickets_per_match': venue_data.get('avg_wickets_per_match', 12),
+            # Venue statistics
+            'venue_avg_first_innings_score': venue_data.get('avg_first_innings_score', 160),
+            'venue_avg_second_innings_score': venue_data.get('avg_second_innings_score', 150),
+            'venue_avg_wickets_per_match': venue_data.get('avg_wickets_per_match', 12),
                 
-                # Pitch conditions
-                'is_pitch_batting_friendly': venue_data.get('is_batting_friendly', 0),
-                'is_pitch_bowling_friendly': venue_data.get('is_bowling_friendly', 0),
+            # Pitch conditions
+            'is_pitch_batting_friendly': venue_data.get('is_batting_friendly', 0),
+            'is_pitch_bowling_friendly': venue_data.get('is_bowling_friendly', 0),
                 
-                # Weather conditions
-                'is_windy': match_data.get('weather', {}).get('is_windy', 0),
-                'is_humid': match_data.get('weather', {}).get('is_humid', 0),
+            # Weather conditions
+            'is_windy': weather.get('is_windy', 0),
+            'is_humid': weather.get('is_humid', 0),
                 
-                # Team strengths
-                'team_batting_strength': 0.5,  # Default values
-                'team_bowling_strength': 0.5,
-                'opposition_batting_strength': 0.5,
-                'opposition_bowling_strength': 0.5,
-                'team_last_5_matches_win_rate': 0.5
-            }
-            
-            # Add team strength calculations if available
-            team1_performance = match_data['team1']['data'].get('recent_performance', {})
-            team2_performance = match_data['team2']['data'].get('recent_performance', {})
-            
-            if player_team == match_data['team1']['name']:
-                prediction_data['team_batting_strength'] = team1_performance.get('batting_strength', 0.5)
-                prediction_data['team_bowling_strength'] = team1_performance.get('bowling_strength', 0.5)
-                prediction_data['opposition_batting_strength'] = team2_performance.get('batting_strength', 0.5)
-                prediction_data['opposition_bowling_strength'] = team2_performance.get('bowling_strength', 0.5)
-                prediction_data['team_last_5_matches_win_rate'] = team1_performance.get('last_5_win_rate', 0.5)
-            else:
-                prediction_data['team_batting_strength'] = team2_performance.get('batting_strength', 0.5)
-                prediction_data['team_bowling_strength'] = team2_performance.get('bowling_strength', 0.5)
-                prediction_data['opposition_batting_strength'] = team1_performance.get('batting_strength', 0.5)
-                prediction_data['opposition_bowling_strength'] = team1_performance.get('bowling_strength', 0.5)
-                prediction_data['team_last_5_matches_win_rate'] = team2_performance.get('last_5_win_rate', 0.5)
-            
-            return prediction_data
-            
-        except Exception as e:
-            self.logger.error(f"Error preparing prediction data: {str(e)}")
-            return {}
+            # Team strengths (0.5 when no recent performance data)
+            'team_batting_strength': team_performance.get('batting_strength', 0.5),
+            'team_bowling_strength': team_performance.get('bowling_strength', 0.5),
+            'opposition_batting_strength': opposition_performance.get('batting_strength', 0.5),
+            'opposition_bowling_strength': opposition_performance.get('bowling_strength', 0.5),
+            'team_last_5_matches_win_rate': team_performance.get('last_5_win_rate', 0.5)
+        }
+        
+        return prediction_data
@@ -1,21 +1,25 @@
 import os
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from datetime import datetime
 import json
 from typing import Dict, Optional
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('data_collection.log'),
-        logging.StreamHandler()
-    ]
-)
+def setup_logging():
+    """Set up logging configuration"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('data_collection.log'),
+            logging.StreamHandler()
+        ]
+    )
 
 class IPLDataCollector:
     def __init__(self):
@@ -30,17 +34,21 @@ class IPLDataCollector:
         """Process matches.csv data."""
         logging.info("Processing matches data...")
         try:
-            matches_df = pd.read_csv(self.dataset_path / 'matches.csv')
-            
-            # Convert date columns to datetime
-            matches_df['date'] = pd.to_datetime(matches_df['date'])
+            # Only the columns used downstream, parsed by Arrow (dates included)
+            matches_df = pd.read_csv(
+                self.dataset_path / 'matches.csv',
+                engine='pyarrow',
+                dtype_backend='pyarrow',
+                usecols=['id', 'season', 'date', 'venue', 'team1', 'team2', 'winner', 'player_of_match'],
+                parse_dates=['date']
+            )
             
             # Handle missing values
             matches_df['winner'] = matches_df['winner'].fillna('No Result')
             matches_df['player_of_match'] = matches_df['player_of_match'].fillna('No Player')
             
             # Save processed data
-            matches_df.to_csv(self.processed_data_path / 'processed_matches.csv', index=False)
+            matches_df.to_parquet(self.processed_data_path / 'processed_matches.parquet', compression='zstd', index=False)
             logging.info("Successfully processed matches data")
             
             return matches_df
@@ -52,18 +60,31 @@ class IPLDataCollector:
         """Process deliveries.csv data."""
         logging.info("Processing deliveries data...")
         try:
-            deliveries_df = pd.read_csv(self.dataset_path / 'deliveries.csv')
+            # Only the columns used downstream, in the narrowest lossless dtypes
+            deliveries_df = pd.read_csv(
+                self.dataset_path / 'deliveries.csv',
+                engine='pyarrow',
+                dtype_backend='pyarrow',
+                usecols=['match_id', 'batter', 'bowler', 'batsman_runs', 'total_runs',
+                         'is_wicket', 'player_dismissed', 'dismissal_kind'],
+                dtype={'match_id': 'int32', 'batsman_runs': 'int8', 'total_runs': 'int8', 'is_wicket': 'int8'}
+            )
             
-            # Handle missing values
-            deliveries_df['player_dismissed'] = deliveries_df['player_dismissed'].fillna('Not Out')
-            deliveries_df['dismissal_kind'] = deliveries_df['dismissal_kind'].fillna('Not Out')
+            # Handle missing values; as categoricals, 'Not Out' is one small
+            # integer code per delivery rather than a string
+            for column in ('player_dismissed', 'dismissal_kind'):
+                dismissals = deliveries_df[column].astype('category')
+                if 'Not Out' not in dismissals.cat.categories:
+                    dismissals = dismissals.cat.add_categories('Not Out')
+                deliveries_df[column] = dismissals.fillna('Not Out')
             
             # Calculate additional metrics
-            deliveries_df['is_boundary'] = deliveries_df['batsman_runs'].apply(lambda x: 1 if x >= 4 else 0)
-            deliveries_df['is_six'] = deliveries_df['batsman_runs'].apply(lambda x: 1 if x == 6 else 0)
+            batsman_runs = deliveries_df['batsman_runs'].to_numpy()
+            deliveries_df['is_boundary'] = (batsman_runs >= 4).view(np.uint8)
+            deliveries_df['is_six'] = (batsman_runs == 6).view(np.uint8)
             
             # Save processed data
-            deliveries_df.to_csv(self.processed_data_path / 'processed_deliveries.csv', index=False)
+            deliveries_df.to_parquet(self.processed_data_path / 'processed_deliveries.parquet', compression='zstd', index=False)
             logging.info("Successfully processed deliveries data")
             
             return deliveries_df
@@ -75,28 +96,44 @@ class IPLDataCollector:
         """Aggregate player statistics from matches and deliveries data."""
         logging.info("Aggregating player statistics...")
         try:
-            # Merge matches and deliveries data
-            merged_df = deliveries_df.merge(
-                matches_df[['id', 'season', 'date', 'venue', 'team1', 'team2']],
-                left_on='match_id',
-                right_on='id'
+            deliveries = pa.Table.from_pandas(
+                deliveries_df[['match_id', 'batter', 'batsman_runs', 'is_boundary', 'is_six']],
+                preserve_index=False
+            )
+            
+            # Keep deliveries of known matches (none of the match columns are
+            # aggregated, so a semi-join filter replaces the merge) and drop
+            # deliveries without a batter, as groupby would
+            known_match = pc.is_in(
+                deliveries['match_id'],
+                value_set=pa.array(matches_df['id'].to_numpy(), type=deliveries['match_id'].type)
             )
+            deliveries = deliveries.filter(pc.and_(known_match, pc.is_valid(deliveries['batter'])))
             
-            # Calculate player statistics
-            player_stats = merged_df.groupby('batter').agg({
-                'batsman_runs': ['sum', 'count', 'mean'],
-                'is_boundary': 'sum',
-                'is_six': 'sum'
-            }).reset_index()
+            # Calculate player statistics with Arrow's multi-threaded hash aggregation
+            aggregated = deliveries.group_by('batter').aggregate([
+                ('batsman_runs', 'sum'),
+                ('batsman_runs', 'count'),
+                ('batsman_runs', 'mean'),
+                ('is_boundary', 'sum'),
+                ('is_six', 'sum')
+            ]).sort_by('batter')
             
             # Rename columns
-            player_stats.columns = ['player', 'total_runs', 'balls_faced', 'average', 'fours', 'sixes']
+            player_stats = pd.DataFrame({
+                'player': aggregated['batter'].to_pandas(),
+                'total_runs': aggregated['batsman_runs_sum'].to_pandas(),
+                'balls_faced': aggregated['batsman_runs_count'].to_pandas(),
+                'average': aggregated['batsman_runs_mean'].to_pandas(),
+                'fours': aggregated['is_boundary_sum'].to_pandas(),
+                'sixes': aggregated['is_six_sum'].to_pandas()
+            })
             
             # Calculate strike rate
             player_stats['strike_rate'] = (player_stats['total_runs'] / player_stats['balls_faced']) * 100
             
             # Save aggregated stats
-            player_stats.to_csv(self.processed_data_path / 'player_stats.csv', index=False)
+            player_stats.to_parquet(self.processed_data_path / 'player_stats.parquet', compression='zstd', index=False)
             logging.info("Successfully aggregated player statistics")
             
             return player_stats
@@ -109,9 +146,12 @@ class IPLDataCollector:
         try:
             logging.info("Starting IPL data processing pipeline...")
             
-            # Process data
-            matches_df = self.process_matches_data()
-            deliveries_df = self.process_deliveries_data()
+            # Process data (independent files; the Arrow CSV reader releases the GIL)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                matches_future = executor.submit(self.process_matches_data)
+                deliveries_future = executor.submit(self.process_deliveries_data)
+                matches_df = matches_future.result()
+                deliveries_df = deliveries_future.result()
             
             # Aggregate statistics
             player_stats = self.aggregate_player_stats(matches_df, deliveries_df)
@@ -129,14 +169,89 @@ class HistoricalDataCollector:
         self.data_path = self.base_path / 'data'
         self.processed_path = self.data_path / 'processed'
         
+        # Ball-by-ball data, loaded once per process
+        self._ball_by_ball = None
+        self._ball_by_ball_parquet = self.processed_path / 'ball_by_ball.parquet'
+        
+        # Per-player aggregates of the ball-by-ball data, built on first use
+        self._batting_by_player = None
+        self._bowling_by_player = None
+        self._catches_by_player = None
+        
+    def _get_ball_by_ball_data(self) -> Optional[pd.DataFrame]:
+        """Load ball-by-ball data once, through a Parquet copy of the CSV"""
+        if self._ball_by_ball is not None:
+            return self._ball_by_ball
+            
+        ball_by_ball_path = Path('IPL-DATASET-main/IPL-DATASET-main/csv/Ball_By_Ball_Match_Data.csv')
+        if not ball_by_ball_path.exists():
+            return None
+            
+        if (self._ball_by_ball_parquet.exists()
+                and self._ball_by_ball_parquet.stat().st_mtime >= ball_by_ball_path.stat().st_mtime):
+            self._ball_by_ball = pd.read_parquet(self._ball_by_ball_parquet)
+        else:
+            self._ball_by_ball = pd.read_csv(ball_by_ball_path)
+            self.processed_path.mkdir(parents=True, exist_ok=True)
+            self._ball_by_ball.to_parquet(self._ball_by_ball_parquet, index=False)
+            
+        return self._ball_by_ball
+        
+    def _precompute_stats(self, ball_by_ball_data: pd.DataFrame) -> None:
+        """Aggregate batting and bowling figures for every player in one pass each"""
+        # Batting totals in one bincount per figure over the batter codes,
+        # without building per-ball indicator columns
+        batters = ball_by_ball_data['Batter'].astype('category')
+        codes = batters.cat.codes.to_numpy()
+        batsman_runs = ball_by_ball_data['BatsmanRun'].to_numpy(dtype=np.int64)
+        has_batter = codes >= 0
+        codes, batsman_runs = codes[has_batter], batsman_runs[has_batter]
+        n_batters = len(batters.cat.categories)
+        totals = {
+            'runs': np.bincount(codes, weights=batsman_runs, minlength=n_batters).astype(np.int64),
+            'balls': np.bincount(codes, minlength=n_batters),
+            'scoring_balls': np.bincount(codes[batsman_runs > 0], minlength=n_batters),
+            'fours': np.bincount(codes[batsman_runs == 4], minlength=n_batters),
+            'sixes': np.bincount(codes[batsman_runs == 6], minlength=n_batters)
+        }
+        self._batting_by_player = pd.DataFrame(totals, index=batters.cat.categories).to_dict('index')
+        
+        bowling = pd.DataFrame({
+            'Bowler': ball_by_ball_data['Bowler'].astype('category'),
+            'wickets': ball_by_ball_data['IsWicketDelivery'],
+            'runs_conceded': ball_by_ball_data['TotalRun'],
+            'balls': 1
+        })
+        # Group on the categorical codes rather than re-hashing every name
+        self._bowling_by_player = bowling.groupby('Bowler', observed=True, sort=False).sum().to_dict('index')
+        
+        # Split fielder lists so every wicket is credited to each named fielder
+        wicket_deliveries = ball_by_ball_data.loc[
+            ball_by_ball_data['IsWicketDelivery'] != 0, ['FieldersInvolved', 'IsWicketDelivery']
+        ]
+        fielders = wicket_deliveries.assign(
+            fielder=wicket_deliveries['FieldersInvolved'].fillna('').str.split(',')
+        ).explode('fielder')
+        self._catches_by_player = (
+            fielders.groupby(fielders['fielder'].str.strip(), sort=False)['IsWicketDelivery']
+            .sum()
+            .to_dict()
+        )
+        
     def _get_batting_stats(self, player_data: pd.DataFrame) -> Dict:
         """Calculate batting statistics from historical data"""
         try:
+            # Reduce each column once (NaN-skipping, like Series.sum)
+            batting_runs = player_data['batting_runs'].to_numpy(dtype=float, na_value=np.nan)
+            runs = np.nansum(batting_runs)
+            balls = np.nansum(player_data['balls_faced'].to_numpy(dtype=float, na_value=np.nan))
+            scoring_innings = int(np.count_nonzero(batting_runs > 0))
+            
             batting_stats = {
-                'runs': int(player_data['batting_runs'].sum()),
-                'balls': int(player_data['balls_faced'].sum()),
-                'average': float(player_data['batting_runs'].sum() / max(1, len(player_data[player_data['batting_runs'] > 0]))),
-                'strike_rate': float(player_data['batting_runs'].sum() / max(1, player_data['balls_faced'].sum()) * 100),
+                'runs': int(runs),
+                'balls': int(balls),
+                'average': float(runs / max(1, scoring_innings)),
+                'strike_rate': float(runs / max(1, balls) * 100),
                 'fours': int(player_data['fours'].sum()),
                 'sixes': int(player_data['sixes'].sum())
             }
@@ -155,12 +270,17 @@ class HistoricalDataCollector:
     def _get_bowling_stats(self, player_data: pd.DataFrame) -> Dict:
         """Calculate bowling statistics from historical data"""
         try:
+            # Reduce each column once
+            wickets = player_data['wickets'].sum()
+            runs_conceded = player_data['runs_conceded'].sum()
+            overs = player_data['overs'].sum()
+            
             bowling_stats = {
-                'wickets': int(player_data['wickets'].sum()),
-                'runs_conceded': int(player_data['runs_conceded'].sum()),
-                'overs': float(player_data['overs'].sum()),
-                'economy': float(player_data['runs_conceded'].sum() / max(1, player_data['overs'].sum())),
-                'average': float(player_data['runs_conceded'].sum() / max(1, player_data['wickets'].sum()))
+                'wickets': int(wickets),
+                'runs_conceded': int(runs_conceded),
+                'overs': float(overs),
+                'economy': float(runs_conceded / max(1, overs)),
+                'average': float(runs_conceded / max(1, wickets))
             }
             return bowling_stats
         except Exception as e:
@@ -193,40 +313,45 @@ class HistoricalDataCollector:
     def get_player_stats(self, player_name: str) -> Dict:
         """Get player's historical statistics"""
         try:
-            # Read ball-by-ball data
-            ball_by_ball_path = Path('IPL-DATASET-main/IPL-DATASET-main/csv/Ball_By_Ball_Match_Data.csv')
-            if not ball_by_ball_path.exists():
-                self.logger.error("Ball-by-ball data file not found")
-                return self._get_default_stats()
+            # Aggregate ball-by-ball data for all players on first use
+            if self._batting_by_player is None:
+                ball_by_ball_data = self._get_ball_by_ball_data()
+                if ball_by_ball_data is None:
+                    self.logger.error("Ball-by-ball data file not found")
+                    return self._get_default_stats()
+                self._precompute_stats(ball_by_ball_data)
                 
-            ball_by_ball_data = pd.read_csv(ball_by_ball_path)
-            
-            # Filter data for the player (as batter and bowler)
-            batting_data = ball_by_ball_data[ball_by_ball_data['Batter'] == player_name]
-            bowling_data = ball_by_ball_data[ball_by_ball_data['Bowler'] == player_name]
+            # Look up the player's aggregates (as batter and bowler)
+            batting = self._batting_by_player.get(player_name, {})
+            bowling = self._bowling_by_player.get(player_name, {})
+            runs = batting.get('runs', 0)
+            balls = batting.get('balls', 0)
+            wickets = bowling.get('wickets', 0)
+            runs_conceded = bowling.get('runs_conceded', 0)
+            balls_bowled = bowling.get('balls', 0)
             
             # Calculate batting stats
             batting_stats = {
-                'runs': int(batting_data['BatsmanRun'].sum()),
-                'balls': len(batting_data),
-                'average': float(batting_data['BatsmanRun'].sum() / max(1, len(batting_data[batting_data['BatsmanRun'] > 0]))),
-                'strike_rate': float(batting_data['BatsmanRun'].sum() / max(1, len(batting_data)) * 100),
-                'fours': len(batting_data[batting_data['BatsmanRun'] == 4]),
-                'sixes': len(batting_data[batting_data['BatsmanRun'] == 6])
+                'runs': int(runs),
+                'balls': int(balls),
+                'average': float(runs / max(1, batting.get('scoring_balls', 0))),
+                'strike_rate': float(runs / max(1, balls) * 100),
+                'fours': int(batting.get('fours', 0)),
+                'sixes': int(batting.get('sixes', 0))
             }
             
             # Calculate bowling stats
             bowling_stats = {
-                'wickets': int(bowling_data['IsWicketDelivery'].sum()),
-                'runs_conceded': int(bowling_data['TotalRun'].sum()),
-                'overs': float(len(bowling_data) / 6),  # Convert balls to overs
-                'economy': float(bowling_data['TotalRun'].sum() / max(1, len(bowling_data) / 6)),
-                'average': float(bowling_data['TotalRun'].sum() / max(1, bowling_data['IsWicketDelivery'].sum()))
+                'wickets': int(wickets),
+                'runs_conceded': int(runs_conceded),
+                'overs': float(balls_bowled / 6),  # Convert balls to overs
+                'economy': float(runs_conceded / max(1, balls_bowled / 6)),
+                'average': float(runs_conceded / max(1, wickets))
             }
             
             # Calculate fielding stats
             fielding_stats = {
-                'catches': int(ball_by_ball_data[ball_by_ball_data['FieldersInvolved'].fillna('').str.contains(player_name, na=False)]['IsWicketDelivery'].sum()),
+                'catches': int(self._catches_by_player.get(player_name, 0)),
                 'stumpings': 0,  # Need additional data to calculate stumpings
                 'run_outs': 0  # Need additional data to calculate run outs
             }
@@ -267,5 +392,6 @@ class HistoricalDataCollector:
         }
 
 if __name__ == "__main__":
+    setup_logging()
     collector = IPLDataCollector()
     collector.run() 
\ No newline at end of file
@@ -96,12 +96,20 @@ MATCHES = [
     # Add all 72 matches
 ]
 
+# Match lookup by number (reversed so the first match with a number wins)
+_MATCH_BY_NO = {match["match_no"]: match for match in reversed(MATCHES)}
+
+class IPL2025Data:
+    """IPL 2025 teams and schedule"""
+    
+    def __init__(self):
+        # Share the module-level tables instead of rebuilding them per instance
+        self.teams = TEAMS
+        self.schedule = MATCHES
+
 def get_match(match_no: int) -> dict:
     """Get match details by match number"""
-    for match in MATCHES:
-        if match["match_no"] == match_no:
-            return match
-    return None
+    return _MATCH_BY_NO.get(match_no)
 
 def get_team(team_name: str) -> dict:
     """Get team details by team name"""
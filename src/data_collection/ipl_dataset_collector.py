@@ -1,17 +1,58 @@
 import pandas as pd
+import numpy as np
 import json
 import requests
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 import zipfile
 import io
 import os
 
 logger = logging.getLogger(__name__)
 
+# Name mapping for players with their variations
+_NAME_MAPPING = {
+    'Virat Kohli': ['V Kohli', 'Virat Kohli'],
+    'Rohit Sharma': ['R Sharma', 'RG Sharma', 'Rohit'],
+    'MS Dhoni': ['MS Dhoni', 'Dhoni'],
+    'Shubman Gill': ['S Gill', 'Shubman Gill'],
+    'VK Ostwal': ['V Ostwal', 'VK Ostwal'],
+    'JB Little': ['J Little', 'JB Little'],
+    'SS Mishra': ['S Mishra', 'SS Mishra'],
+    'AM Ghazanfar': ['A Ghazanfar', 'AM Ghazanfar'],
+    'Sakib Hussain': ['S Hussain', 'Sakib Hussain'],
+    'AAP Atkinson': ['A Atkinson', 'AAP Atkinson']
+}
+
+@lru_cache(maxsize=None)
+def _name_variations(player_name: str) -> Tuple[str, ...]:
+    """Get the mapped names or create variations of the original name"""
+    if player_name in _NAME_MAPPING:
+        return tuple(_NAME_MAPPING[player_name])
+    
+    variations = [player_name]
+    # Split name and try with initials
+    parts = player_name.split()
+    if len(parts) > 1:
+        initials = ''.join(p[0] for p in parts[:-1])
+        last_name = parts[-1]
+        variations.append(f"{initials} {last_name}")
+    return tuple(variations)
+
 class IPLDatasetCollector:
+    # Columns read from each CSV (all columns for files not listed)
+    _CSV_COLUMNS = {
+        'Ball_By_Ball_Match_Data.csv': ['ID', 'Batter', 'Bowler', 'BatsmanRun', 'TotalRun', 'IsWicketDelivery']
+    }
+    
+    # Column dtypes; player names are few and repeated on every delivery
+    _CSV_DTYPES = {
+        'Ball_By_Ball_Match_Data.csv': {'Batter': 'category', 'Bowler': 'category'}
+    }
+    
     def __init__(self, dataset_path: str):
         """Initialize the IPL dataset collector."""
         self.dataset_path = Path(dataset_path)
@@ -41,6 +82,15 @@ class IPLDatasetCollector:
         self._cache = {}
         self._cache_duration = 3600  # 1 hour
         
+        # Dataset CSVs, read once per collector
+        self._csv_data = {}
+        
+        # Per-player aggregates of the ball-by-ball data, built on first use
+        self._batting_by_player = None
+        self._bowling_by_player = None
+        self._all_players = None
+        self._matches_by_player = None
+        
     def download_dataset(self):
         """Download and extract the IPL dataset"""
         try:
@@ -60,6 +110,39 @@ class IPLDatasetCollector:
             self.logger.error(f"Error downloading dataset: {str(e)}")
             return False
             
+    def _load_csv(self, path: Path) -> pd.DataFrame:
+        """Read a dataset CSV on first use and reuse it afterwards"""
+        if path not in self._csv_data:
+            self._csv_data[path] = pd.read_csv(
+                path,
+                usecols=self._CSV_COLUMNS.get(path.name),
+                dtype=self._CSV_DTYPES.get(path.name)
+            )
+        return self._csv_data[path]
+        
+    def _precompute_player_stats(self, ball_data: pd.DataFrame) -> None:
+        """Aggregate batting and bowling figures for every player in one pass each"""
+        deliveries = ball_data.assign(is_out=ball_data['IsWicketDelivery'] == 1)
+        batting = deliveries.groupby('Batter', observed=True, sort=False).agg(
+            runs=('BatsmanRun', 'sum'),
+            balls=('BatsmanRun', 'size'),
+            outs=('is_out', 'sum')
+        )
+        bowling = ball_data.groupby('Bowler', observed=True, sort=False).agg(
+            runs_conceded=('TotalRun', 'sum'),
+            balls=('TotalRun', 'size')
+        )
+        self._batting_by_player = batting.to_dict('index')
+        self._bowling_by_player = bowling.to_dict('index')
+        self._all_players = set(self._batting_by_player) | set(self._bowling_by_player)
+        
+        # Matches each player batted or bowled in
+        self._matches_by_player = {}
+        for column in ('Batter', 'Bowler'):
+            match_ids = ball_data.groupby(column, observed=True, sort=False)['ID'].unique()
+            for player, ids in match_ids.items():
+                self._matches_by_player.setdefault(player, set()).update(ids)
+        
     def get_player_stats(self, player_name: str) -> Dict[str, Any]:
         """Get player statistics from IPL dataset."""
         try:
@@ -85,42 +168,17 @@ class IPLDatasetCollector:
                     'recent_matches': 0
                 }
             
-            ball_data = pd.read_csv(ball_data_path)
-            
-            # Get all unique player names from the dataset for fuzzy matching
-            all_batters = set(ball_data['Batter'].dropna().unique())
-            all_bowlers = set(ball_data['Bowler'].dropna().unique())
-            all_players = all_batters.union(all_bowlers)
-            
-            # Name mapping for players with their variations
-            name_mapping = {
-                'Virat Kohli': ['V Kohli', 'Virat Kohli'],
-                'Rohit Sharma': ['R Sharma', 'RG Sharma', 'Rohit'],
-                'MS Dhoni': ['MS Dhoni', 'Dhoni'],
-                'Shubman Gill': ['S Gill', 'Shubman Gill'],
-                'VK Ostwal': ['V Ostwal', 'VK Ostwal'],
-                'JB Little': ['J Little', 'JB Little'],
-                'SS Mishra': ['S Mishra', 'SS Mishra'],
-                'AM Ghazanfar': ['A Ghazanfar', 'AM Ghazanfar'],
-                'Sakib Hussain': ['S Hussain', 'Sakib Hussain'],
-                'AAP Atkinson': ['A Atkinson', 'AAP Atkinson']
-            }
+            ball_data = self._load_csv(ball_data_path)
+            
+            # Aggregate the ball-by-ball data for all players on first use
+            if self._batting_by_player is None:
+                self._precompute_player_stats(ball_data)
+            
+            # All player names in the dataset, for fuzzy matching
+            all_players = self._all_players
             
-            # Get the mapped names or create variations of the original name
-            mapped_names = name_mapping.get(player_name, [player_name])
-            if not isinstance(mapped_names, list):
-                mapped_names = [mapped_names]
-            
-            # Also try variations of the name if not in mapping
-            if player_name not in name_mapping:
-                # Split name and try with initials
-                parts = player_name.split()
-                if len(parts) > 1:
-                    initials = ''.join(p[0] for p in parts[:-1])
-                    last_name = parts[-1]
-                    mapped_names.append(f"{initials} {last_name}")
-                    # Also try with space after initials
-                    mapped_names.append(f"{initials} {last_name}")
+            # Get the mapped names or variations of the original name
+            mapped_names = list(_name_variations(player_name))
             
             # Try fuzzy matching - check if any part of the name matches
             if not any(name in all_players for name in mapped_names):
@@ -130,13 +188,12 @@ class IPLDatasetCollector:
                 if matching_players:
                     mapped_names.extend(matching_players[:3])  # Add top 3 matches
             
-            # Find matches for any of the name variations
-            player_matches = ball_data[
-                (ball_data['Batter'].isin(mapped_names)) | 
-                (ball_data['Bowler'].isin(mapped_names))
-            ]
+            # Look up the aggregates of every distinct name variation
+            names = set(mapped_names)
+            batting = [self._batting_by_player[name] for name in names if name in self._batting_by_player]
+            bowling = [self._bowling_by_player[name] for name in names if name in self._bowling_by_player]
             
-            if player_matches.empty:
+            if not batting and not bowling:
                 logger.warning(f"No matches found for player {player_name} (tried variations: {mapped_names[:5]})")
                 return {
                     'batting_average': 0.0,
@@ -146,23 +203,23 @@ class IPLDatasetCollector:
                 }
             
             # Calculate batting stats
-            batting_stats = player_matches[player_matches['Batter'].isin(mapped_names)]
-            total_runs = batting_stats['BatsmanRun'].sum()
-            total_balls = len(batting_stats)
-            total_wickets = len(batting_stats[batting_stats['IsWicketDelivery'] == 1])
+            total_runs = sum(stats['runs'] for stats in batting)
+            total_balls = sum(stats['balls'] for stats in batting)
+            total_wickets = sum(stats['outs'] for stats in batting)
             
             batting_average = total_runs / total_wickets if total_wickets > 0 else total_runs
             strike_rate = (total_runs / total_balls * 100) if total_balls > 0 else 0.0
             
             # Calculate bowling stats
-            bowling_stats = player_matches[player_matches['Bowler'].isin(mapped_names)]
-            total_runs_given = bowling_stats['TotalRun'].sum()
-            total_overs = len(bowling_stats) / 6  # Assuming 6 balls per over
+            total_runs_given = sum(stats['runs_conceded'] for stats in bowling)
+            total_overs = sum(stats['balls'] for stats in bowling) / 6  # Assuming 6 balls per over
             
             bowling_economy = total_runs_given / total_overs if total_overs > 0 else 0.0
             
             # Get recent matches (last 5)
-            recent_matches = len(player_matches['ID'].unique())
+            recent_matches = len(set().union(*(
+                self._matches_by_player[name] for name in names if name in self._matches_by_player
+            )))
             
             return {
                 'batting_average': batting_average,
@@ -184,38 +241,55 @@ class IPLDatasetCollector:
         """Get player's match-wise performance"""
         try:
             # Load match data
-            match_data = pd.read_csv(self.csv_dir / 'Match_Info.csv')
-            ball_data = pd.read_csv(self.csv_dir / 'Ball_By_Ball_Match_Data.csv')
+            match_data = self._load_csv(self.csv_dir / 'Match_Info.csv')
+            ball_data = self._load_csv(self.csv_dir / 'Ball_By_Ball_Match_Data.csv')
             
-            # Get matches where player participated
-            player_matches = ball_data[
-                (ball_data['Batter'] == player_name) |
-                (ball_data['Bowler'] == player_name)
-            ]['ID'].unique()
+            # Get the player's deliveries and the matches they played in
+            batting_mask = ball_data['Batter'] == player_name
+            bowling_mask = ball_data['Bowler'] == player_name
+            player_matches = ball_data.loc[batting_mask | bowling_mask, 'ID'].unique()
             
             match_stats = []
-            for match_id in player_matches:
-                # Get match details
-                match = match_data[match_data['ID'] == match_id].iloc[0]
-                
-                # Get player's performance in this match
-                match_ball_data = ball_data[ball_data['ID'] == match_id]
-                batting_data = match_ball_data[match_ball_data['Batter'] == player_name]
-                bowling_data = match_ball_data[match_ball_data['Bowler'] == player_name]
-                
+            if len(player_matches) == 0:
+                return match_stats
+            
+            # Match date by ID (first row per match)
+            match_dates = match_data.drop_duplicates('ID').set_index('ID')['Date']
+            
+            # Aggregate the player's performance per match in one pass per role
+            batting_data = ball_data.loc[batting_mask, ['ID', 'BatsmanRun']]
+            batting = batting_data.assign(
+                is_four=batting_data['BatsmanRun'] == 4,
+                is_six=batting_data['BatsmanRun'] == 6
+            ).groupby('ID', sort=False).agg(
+                runs=('BatsmanRun', 'sum'),
+                balls=('BatsmanRun', 'size'),
+                fours=('is_four', 'sum'),
+                sixes=('is_six', 'sum')
+            ).reindex(player_matches, fill_value=0)
+            bowling_data = ball_data.loc[bowling_mask, ['ID', 'TotalRun', 'IsWicketDelivery']]
+            bowling = bowling_data.assign(
+                is_wicket=bowling_data['IsWicketDelivery'] == 1
+            ).groupby('ID', sort=False).agg(
+                wickets=('is_wicket', 'sum'),
+                runs_conceded=('TotalRun', 'sum'),
+                balls=('TotalRun', 'size')
+            ).reindex(player_matches, fill_value=0)
+            
+            for match_id, bat, bowl in zip(player_matches, batting.itertuples(), bowling.itertuples()):
                 match_stats.append({
                     'match_id': match_id,
-                    'date': match['Date'],
+                    'date': match_dates[match_id],
                     'batting': {
-                        'runs': int(batting_data['BatsmanRun'].sum()),
-                        'balls': len(batting_data),
-                        'fours': len(batting_data[batting_data['BatsmanRun'] == 4]),
-                        'sixes': len(batting_data[batting_data['BatsmanRun'] == 6])
+                        'runs': int(bat.runs),
+                        'balls': int(bat.balls),
+                        'fours': int(bat.fours),
+                        'sixes': int(bat.sixes)
                     },
                     'bowling': {
-                        'wickets': len(bowling_data[bowling_data['IsWicketDelivery'] == 1]),
-                        'runs_conceded': int(bowling_data['TotalRun'].sum()),
-                        'overs': len(bowling_data) / 6
+                        'wickets': int(bowl.wickets),
+                        'runs_conceded': int(bowl.runs_conceded),
+                        'overs': int(bowl.balls) / 6
                     }
                 })
             
@@ -251,7 +325,7 @@ class IPLDatasetCollector:
                     return cached_data['data']
             
             # Load match data
-            match_data = pd.read_csv(self.csv_dir / 'Match_Info.csv')
+            match_data = self._load_csv(self.csv_dir / 'Match_Info.csv')
             
             # Filter data for the team
             team_matches = match_data[
@@ -261,11 +335,11 @@ class IPLDatasetCollector:
             
             # Calculate team stats
             total_matches = len(team_matches)
-            wins = len(team_matches[team_matches['WinningTeam'] == team_name])
+            wins = int(np.count_nonzero(team_matches['WinningTeam'].to_numpy() == team_name))
             
             # Get recent form (last 5 matches)
             recent_matches = team_matches.sort_values('Date', ascending=False).head(5)
-            recent_wins = len(recent_matches[recent_matches['WinningTeam'] == team_name])
+            recent_wins = int(np.count_nonzero(recent_matches['WinningTeam'].to_numpy() == team_name))
             
             stats = {
                 'total_matches': total_matches,
@@ -307,7 +381,7 @@ class IPLDatasetCollector:
         """Get match statistics from the IPL dataset"""
         try:
             # Load match data
-            match_data = pd.read_csv(self.csv_dir / 'Match_Info.csv')
+            match_data = self._load_csv(self.csv_dir / 'Match_Info.csv')
             
             # Convert match_id to string for comparison
             match_id = str(match_id)
@@ -332,8 +406,8 @@ class IPLDatasetCollector:
                 'toss_decision': match['toss_decision'],
                 'winner': match['winner'],
                 'player_of_match': match['player_of_match'],
-                'team1_players': eval(match['team1_players']),
-                'team2_players': eval(match['team2_players'])
+                'team1_players': [name.strip() for name in match['team1_players'].split(',')],
+                'team2_players': [name.strip() for name in match['team2_players'].split(',')]
             }
             
             return match_info
@@ -346,7 +420,7 @@ class IPLDatasetCollector:
         """Get team roster from the IPL dataset"""
         try:
             # Load teams info
-            teams_data = pd.read_csv(self.csv_dir / 'teams_info.csv')
+            teams_data = self._load_csv(self.csv_dir / 'teams_info.csv')
             
             # Filter for the specific team
             team_data = teams_data[teams_data['team_name'] == team_name]
@@ -363,7 +437,7 @@ class IPLDatasetCollector:
             team_id = team_data.iloc[0]['espn_id']
             
             # Load player details
-            players_data = pd.read_csv(self.csv_dir / '2024_players_details.csv')
+            players_data = self._load_csv(self.csv_dir / '2024_players_details.csv')
             
             # Categorize players based on playing roles
             roster = {
@@ -5,7 +5,7 @@ from pathlib import Path
 import logging
 from datetime import datetime
 import json
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # Set up logging
 logging.basicConfig(
@@ -24,9 +24,17 @@ class PlayerAnalyzer:
         self.processed_data_path.mkdir(parents=True, exist_ok=True)
         
         # Load historical data
-        self.matches_df = pd.read_csv(self.processed_data_path / 'processed_matches.csv')
-        self.deliveries_df = pd.read_csv(self.processed_data_path / 'processed_deliveries.csv')
-        self.player_stats_df = pd.read_csv(self.processed_data_path / 'player_stats.csv')
+        self.matches_df = pd.read_parquet(self.processed_data_path / 'processed_matches.parquet')
+        self.deliveries_df = pd.read_parquet(self.processed_data_path / 'processed_deliveries.parquet')
+        self.player_stats_df = pd.read_parquet(self.processed_data_path / 'player_stats.parquet')
+        
+        # Player stats rows by player name (first row per player)
+        self._player_stats_by_name = (
+            self.player_stats_df.drop_duplicates('player').set_index('player').to_dict('index')
+        )
+        
+        # Team analyses by team name (the stats above do not change)
+        self._team_analyses = {}
         
         # IPL 2024 Teams and their key players (based on 2024 auction)
         self.teams = {
@@ -76,9 +84,9 @@ class PlayerAnalyzer:
         """Analyze historical performance of a player."""
         try:
             # Get player's batting stats
-            batting_stats = self.player_stats_df[self.player_stats_df['player'] == player_name]
+            stats = self._player_stats_by_name.get(player_name)
             
-            if batting_stats.empty:
+            if stats is None:
                 return {
                     'player': player_name,
                     'total_runs': 0,
@@ -89,7 +97,6 @@ class PlayerAnalyzer:
                     'sixes': 0
                 }
             
-            stats = batting_stats.iloc[0]
             return {
                 'player': player_name,
                 'total_runs': int(stats['total_runs']),
@@ -106,6 +113,9 @@ class PlayerAnalyzer:
     def analyze_team_composition(self, team_name: str) -> Dict:
         """Analyze team composition and strength."""
         try:
+            if team_name in self._team_analyses:
+                return self._team_analyses[team_name]
+            
             team_info = self.teams[team_name]
             team_analysis = {
                 'team': team_name,
@@ -118,11 +128,33 @@ class PlayerAnalyzer:
             for player in team_info['key_players']:
                 team_analysis['player_stats'][player] = self.analyze_player_performance(player)
             
+            self._team_analyses[team_name] = team_analysis
             return team_analysis
         except Exception as e:
             logging.error(f"Error analyzing team {team_name}: {str(e)}")
             return {}
 
+    def _team_strength(self, team_analysis: Dict) -> float:
+        """Calculate team strength based on the key players' stats."""
+        return sum(
+            stats['total_runs'] * 0.7 + stats['strike_rate'] * 0.3
+            for stats in team_analysis['player_stats'].values()
+        )
+
+    def _match_prediction(self, team1_analysis: Dict, team2_analysis: Dict, team1_strength: float,
+                          team2_strength: float, team1_probability: float) -> Dict:
+        """Assemble the prediction for a match between two analyzed teams."""
+        return {
+            'team1': team1_analysis['team'],
+            'team2': team2_analysis['team'],
+            'team1_strength': team1_strength,
+            'team2_strength': team2_strength,
+            'team1_win_probability': team1_probability,
+            'team2_win_probability': 100 - team1_probability,
+            'team1_analysis': team1_analysis,
+            'team2_analysis': team2_analysis
+        }
+
     def generate_match_predictions(self, team1: str, team2: str) -> Dict:
         """Generate predictions for a match between two teams."""
         try:
@@ -130,40 +162,67 @@ class PlayerAnalyzer:
             team2_analysis = self.analyze_team_composition(team2)
             
             # Calculate team strength based on player stats
-            team1_strength = sum(
-                stats['total_runs'] * 0.7 + stats['strike_rate'] * 0.3
-                for stats in team1_analysis['player_stats'].values()
-            )
-            
-            team2_strength = sum(
-                stats['total_runs'] * 0.7 + stats['strike_rate'] * 0.3
-                for stats in team2_analysis['player_stats'].values()
-            )
+            team1_strength = self._team_strength(team1_analysis)
+            team2_strength = self._team_strength(team2_analysis)
             
             # Calculate win probability
             total_strength = team1_strength + team2_strength
             team1_probability = (team1_strength / total_strength) * 100 if total_strength > 0 else 50
             
-            return {
-                'team1': team1,
-                'team2': team2,
-                'team1_strength': team1_strength,
-                'team2_strength': team2_strength,
-                'team1_win_probability': team1_probability,
-                'team2_win_probability': 100 - team1_probability,
-                'team1_analysis': team1_analysis,
-                'team2_analysis': team2_analysis
-            }
+            return self._match_prediction(
+                team1_analysis, team2_analysis, team1_strength, team2_strength, team1_probability
+            )
         except Exception as e:
             logging.error(f"Error generating predictions for {team1} vs {team2}: {str(e)}")
             return {}
 
-    def save_data(self, data: Dict, filename: str):
-        """Save data to JSON file."""
+    def _iter_match_predictions(self, team_analyses: Dict) -> Iterable[Tuple[str, Dict]]:
+        """Generate predictions for all possible matchups, one at a time."""
+        # Each team's strength once, then every pairing's win probability
+        # in one pass
+        teams = list(self.teams.keys())
+        strengths = np.array([self._team_strength(team_analyses[team]) for team in teams])
+        total_strengths = strengths[:, None] + strengths[None, :]
+        has_strength = total_strengths > 0
+        win_probabilities = np.divide(
+            strengths[:, None], total_strengths,
+            out=np.zeros(total_strengths.shape), where=has_strength
+        ) * 100
+        for i, j in zip(*np.triu_indices(len(teams), k=1)):
+            team1, team2 = teams[i], teams[j]
+            match_key = f"{team1}_vs_{team2}"
+            logging.info(f"Generating predictions for {match_key}...")
+            team1_probability = win_probabilities[i, j].item() if has_strength[i, j] else 50
+            yield match_key, self._match_prediction(
+                team_analyses[team1], team_analyses[team2],
+                strengths[i].item(), strengths[j].item(), team1_probability
+            )
+
+    def save_data(self, data: Dict, filename: str, indent: Optional[int] = 4):
+        """Save data to JSON file (compact, via the C encoder, if indent is None)."""
+        try:
+            filepath = self.processed_data_path / filename
+            with open(filepath, 'w', encoding='utf-8') as f:
+                # Serialize in memory and write once, rather than chunk by chunk
+                f.write(json.dumps(data, indent=indent, ensure_ascii=False))
+            logging.info(f"Successfully saved data to {filename}")
+        except Exception as e:
+            logging.error(f"Error saving data: {str(e)}")
+            raise
+
+    def save_entries(self, entries: Iterable[Tuple[str, Dict]], filename: str):
+        """Save (key, value) pairs to a compact JSON object, one entry at a time."""
         try:
             filepath = self.processed_data_path / filename
             with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+                f.write('{')
+                for i, (key, value) in enumerate(entries):
+                    if i:
+                        f.write(', ')
+                    f.write(json.dumps(key, ensure_ascii=False))
+                    f.write(': ')
+                    f.write(json.dumps(value, ensure_ascii=False))
+                f.write('}')
             logging.info(f"Successfully saved data to {filename}")
         except Exception as e:
             logging.error(f"Error saving data: {str(e)}")
@@ -180,36 +239,32 @@ class PlayerAnalyzer:
                 logging.info(f"Analyzing {team}...")
                 team_analyses[team] = self.analyze_team_composition(team)
             
-            # Generate predictions for all possible matchups
-            match_predictions = {}
-            teams = list(self.teams.keys())
-            for i in range(len(teams)):
-                for j in range(i + 1, len(teams)):
-                    team1, team2 = teams[i], teams[j]
-                    match_key = f"{team1}_vs_{team2}"
-                    logging.info(f"Generating predictions for {match_key}...")
-                    match_predictions[match_key] = self.generate_match_predictions(team1, team2)
+            # Per-team totals for the summary, reduced once
+            team_stats = [analysis['player_stats'] for analysis in team_analyses.values()]
+            total_runs = np.fromiter(
+                (sum(stats['total_runs'] for stats in players.values()) for players in team_stats),
+                dtype=np.int64, count=len(team_stats)
+            )
+            avg_strike_rates = np.fromiter(
+                (np.mean([stats['strike_rate'] for stats in players.values()]) for players in team_stats),
+                dtype=np.float64, count=len(team_stats)
+            )
+            key_players = np.fromiter((len(players) for players in team_stats), dtype=np.int64, count=len(team_stats))
             
             # Save all data
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.save_data(team_analyses, f"team_analyses_{timestamp}.json")
-            self.save_data(match_predictions, f"match_predictions_{timestamp}.json")
-            
-            # Create a summary DataFrame
-            summary_data = []
-            for team, analysis in team_analyses.items():
-                team_stats = analysis['player_stats']
-                total_runs = sum(stats['total_runs'] for stats in team_stats.values())
-                avg_strike_rate = np.mean([stats['strike_rate'] for stats in team_stats.values()])
-                
-                summary_data.append({
-                    'team': team,
-                    'total_runs': total_runs,
-                    'avg_strike_rate': avg_strike_rate,
-                    'key_players': len(team_stats)
-                })
+            # Predictions repeat both team analyses for every pairing, so they
+            # are streamed to disk compactly instead of being held in memory
+            self.save_entries(self._iter_match_predictions(team_analyses), f"match_predictions_{timestamp}.json")
             
-            summary_df = pd.DataFrame(summary_data)
+            # Create a summary DataFrame from the per-team totals
+            summary_df = pd.DataFrame({
+                'team': list(team_analyses),
+                'total_runs': total_runs,
+                'avg_strike_rate': avg_strike_rates,
+                'key_players': key_players
+            })
             summary_df.to_csv(self.processed_data_path / f"team_summary_{timestamp}.csv", index=False)
             
             logging.info("Successfully completed player and team analysis")
@@ -4,6 +4,7 @@ import logging
 from datetime import datetime
 from pathlib import Path
 import json
+import numpy as np
 from typing import Dict, List
 from web_scraper import CricketWebScraper
 from cricket_sources import CricketDataSources
@@ -31,6 +32,12 @@ class CricketDataScheduler:
         schedule_path = self.base_path / 'data' / 'processed' / 'ipl2024_schedule_20240401_145632.json'
         with open(schedule_path, 'r') as f:
             self.schedule = json.load(f)
+        
+        # Match dates parsed once, for vectorized date filters
+        self._match_dates = np.array(
+            [datetime.strptime(match['date'], '%Y-%m-%d').date() for match in self.schedule],
+            dtype='datetime64[D]'
+        )
 
     def update_injury_data(self):
         """Update injury data every 6 hours"""
@@ -114,10 +121,9 @@ class CricketDataScheduler:
         """Update match predictions every 12 hours"""
         logging.info("Starting match predictions update")
         try:
-            current_date = datetime.now().date()
+            current_date = np.datetime64(datetime.now().date(), 'D')
             upcoming_matches = [
-                match for match in self.schedule
-                if datetime.strptime(match['date'], '%Y-%m-%d').date() >= current_date
+                self.schedule[i] for i in np.flatnonzero(self._match_dates >= current_date)
             ]
             
             predictions = {}
@@ -17,16 +17,7 @@ from .test_data import SAMPLE_MATCHES, SAMPLE_RESULTS, SAMPLE_PLAYER_STATS
 # Load environment variables
 load_dotenv()
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('web_scraper.log'),
-        logging.StreamHandler()
-    ]
-)
-
+# Logging is configured by the entry points (scheduler, update_predictions, ...)
 logger = logging.getLogger(__name__)
 
 class CricketWebScraper: